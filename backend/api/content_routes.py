@@ -3,11 +3,11 @@ Content preview API routes
 Endpoints for displaying file contents
 """
 
-import json
 import csv
 import io
 from fastapi import APIRouter, HTTPException
 from models.schemas import PreviewRequest, PreviewResult
+from services.json_io import json_loads
 
 router = APIRouter()
 
@@ -15,7 +15,7 @@ router = APIRouter()
 def _parse_json_content(content: str, max_items: int = 50) -> dict:
     """Parse JSON content and return summary with sample items."""
     try:
-        data = json.loads(content)
+        data = json_loads(content)
         
         if isinstance(data, list):
             return {
@@ -31,7 +31,7 @@ def _parse_json_content(content: str, max_items: int = 50) -> dict:
             }
         else:
             return {"data": data}
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return {"error": f"Invalid JSON: {str(e)}"}
 
 
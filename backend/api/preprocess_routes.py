@@ -18,12 +18,13 @@ from services.preprocess_service import (
     preprocess_subscriptions,
     preprocess_all_files
 )
-from services.session_service import create_session, get_session
+from services.session_service import create_session, get_session, register_session_file
 from datetime import datetime
 import uuid
-import json
 from pathlib import Path
 
+from services.json_io import json_loads, json_dump_bytes
+
 router = APIRouter()
 
 # Storage for preprocessed sessions
@@ -141,11 +142,13 @@ async def preprocess_and_store(request: PreprocessRequest):
         "created_at": created_at
     }
     
-    # Save to file
+    # Save to file (bytes in one shot via orjson when available)
     session_path = STORAGE_DIR / f"preprocessed_{token}.json"
-    with open(session_path, 'w', encoding='utf-8') as f:
-        json.dump(session_data, f, indent=2)
-    
+    session_path.write_bytes(json_dump_bytes(session_data, indent=True))
+    # Register with the session index so list/cleanup see this session
+    # without rescanning the storage dir
+    register_session_file(session_path, token, request.timezone, created_at)
+
     stats = PreprocessStats(
         total_watch=result["stats"]["total_watch"],
         total_search=result["stats"]["total_search"],
@@ -174,8 +177,8 @@ async def get_preprocessed_session(token: str):
         raise HTTPException(status_code=404, detail="Preprocessed session not found")
     
     try:
-        with open(session_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(session_path, 'rb') as f:
+            data = json_loads(f.read())
         
         return PreprocessedSessionData(
             token=data["token"],
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from pathlib import Path
-import json
+from services.json_io import json_loads, json_dump_bytes
 
 from services.micro_topic_service import (
     extract_micro_topics_v2,
@@ -77,8 +77,8 @@ async def enrich_session_topics(token: str):
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Load events
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = json_loads(f.read())
     
     events = data.get("events", [])
     
@@ -103,8 +103,7 @@ async def enrich_session_topics(token: str):
     data["micro_topics_extracted"] = True
     data["extraction_version"] = "v2"
     
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    file_path.write_bytes(json_dump_bytes(data, indent=True))
     
     return {
         "token": token,
@@ -139,8 +138,8 @@ async def get_session_topics(token: str, top_n: int = 50):
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Load events
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = json_loads(f.read())
     
     events = data.get("events", [])
     
@@ -5,7 +5,7 @@ Endpoints for scanning and extracting files from YouTube Takeout ZIPs
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form
 from models.schemas import ScanResult, ExtractResult, ExtractedFile
-from services.zip_service import read_zip_for_files, extract_files_by_paths
+from services.zip_service import read_zip_for_files, extract_files_by_paths, scan_and_extract
 from services.timezone_service import validate_timezone
 
 router = APIRouter()
@@ -22,8 +22,9 @@ async def read_zip(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="File must be a ZIP archive")
     
     try:
-        content = await file.read()
-        result = read_zip_for_files(content)
+        # Pass the spooled upload file straight through; the service
+        # seeks it itself, so the archive is never copied into memory
+        result = read_zip_for_files(file.file)
         
         return ScanResult(
             found_files=result["found_files"],
@@ -47,10 +48,11 @@ async def extract_zip(
     
     Args:
         file: The ZIP file
-        paths: JSON string mapping filename to path in ZIP
+        paths: JSON string mapping filename to path in ZIP; when empty,
+            the archive is scanned and extracted in a single pass
         timezone: User's timezone for timestamp conversion
     """
-    import json
+    from services.json_io import json_loads
     
     if not file.filename or not file.filename.endswith('.zip'):
         raise HTTPException(status_code=400, detail="File must be a ZIP archive")
@@ -59,16 +61,18 @@ async def extract_zip(
         raise HTTPException(status_code=400, detail=f"Invalid timezone: {timezone}")
     
     try:
-        paths_dict = json.loads(paths) if paths else {}
-    except json.JSONDecodeError:
+        paths_dict = json_loads(paths) if paths else {}
+    except ValueError:
         raise HTTPException(status_code=400, detail="Invalid paths JSON")
     
-    if not paths_dict:
-        raise HTTPException(status_code=400, detail="No paths provided for extraction")
-    
     try:
-        content = await file.read()
-        extracted_files, missing_files = extract_files_by_paths(content, paths_dict)
+        if paths_dict:
+            extracted_files, missing_files = extract_files_by_paths(file.file, paths_dict)
+        else:
+            # No paths known up front: locate and extract the target
+            # files inside one archive open instead of requiring a
+            # second upload through /read first
+            extracted_files, missing_files = scan_and_extract(file.file)
         
         return ExtractResult(
             files=[ExtractedFile(**f) for f in extracted_files],
@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for the backend test suite.
+
+Model loading is session-scoped so one pytest run pays the multi-second
+spaCy load once, instead of once per script invocation like the old
+standalone test scripts did.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def spacy_model():
+    """English spaCy pipeline, loaded once for the whole session."""
+    pytest.importorskip("spacy")
+    from services.micro_topic_service import get_spacy_english_md
+
+    nlp = get_spacy_english_md()
+    if nlp is None:
+        pytest.skip("en_core_web_md is not installed")
+    return nlp
+
+
+@pytest.fixture(scope="session")
+def test_events():
+    """Events from the checked-in testing_json.json sample."""
+    from services.json_io import json_loads
+
+    test_file = BACKEND_DIR.parent / "testing_json.json"
+    if not test_file.exists():
+        pytest.skip("testing_json.json sample not present")
+    return json_loads(test_file.read_bytes()).get("events", [])
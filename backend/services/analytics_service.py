@@ -5,9 +5,15 @@ Computes insights from preprocessed session data
 
 from collections import Counter
 from typing import Optional
-import json
 from pathlib import Path
 
+from services.json_io import json_loads
+
+# Day-of-week names indexed by datetime.weekday(); shared by the trend
+# and distribution helpers instead of being rebuilt per call
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday",
+             "Saturday", "Sunday")
+
 
 def load_session_events(token: str) -> tuple[list[dict], dict]:
     """Load events and stats from a preprocessed session."""
@@ -17,8 +23,10 @@ def load_session_events(token: str) -> tuple[list[dict], dict]:
     if not session_path.exists():
         return [], {}
     
-    with open(session_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # orjson (via json_io) parses the big event arrays several times
+    # faster than stdlib json and takes bytes directly
+    with open(session_path, 'rb') as f:
+        data = json_loads(f.read())
     
     return data.get("events", []), data.get("stats", {})
 
@@ -207,8 +215,6 @@ def get_watch_patterns(token: str) -> dict:
     peak_hour = max(hourly_dist, key=lambda x: x["count"]) if hourly_dist else None
     peak_day = max(daily_dist, key=lambda x: x["count"]) if daily_dist else None
     
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    
     # === Weekly Peak Day Analysis ===
     # Group events by week (using ISO week number) and find peak day for each week
     from datetime import datetime
@@ -219,13 +225,13 @@ def get_watch_patterns(token: str) -> dict:
         dow = e.get("day_of_week")
         if ts and dow is not None:
             try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(ts)
                 year, week, _ = dt.isocalendar()
                 key = (year, week)
                 if key not in weekly_data:
                     weekly_data[key] = Counter()
                 weekly_data[key][dow] += 1
-            except:
+            except (ValueError, TypeError):
                 pass
     
     # Find peak day for each week
@@ -239,7 +245,7 @@ def get_watch_patterns(token: str) -> dict:
             weekly_peak_days.append({
                 "year": year,
                 "week": week,
-                "peak_day": day_names[peak_dow],
+                "peak_day": DAY_NAMES[peak_dow],
                 "peak_day_num": peak_dow,
                 "count": peak_count
             })
@@ -250,7 +256,7 @@ def get_watch_patterns(token: str) -> dict:
     overall_peak_wins = 0
     if peak_day_counter:
         winner_dow = max(peak_day_counter.keys(), key=lambda d: peak_day_counter[d])
-        overall_peak_day = day_names[winner_dow]
+        overall_peak_day = DAY_NAMES[winner_dow]
         overall_peak_wins = peak_day_counter[winner_dow]
     
     # === Time Intervals ===
@@ -307,7 +313,7 @@ def get_watch_patterns(token: str) -> dict:
         "daily_distribution": daily_dist,
         "peak_hour": peak_hour["hour"] if peak_hour else None,
         "peak_hour_count": peak_hour["count"] if peak_hour else 0,
-        "peak_day": day_names[peak_day["day"]] if peak_day and peak_day["day"] is not None else None,
+        "peak_day": DAY_NAMES[peak_day["day"]] if peak_day and peak_day["day"] is not None else None,
         "peak_day_count": peak_day["count"] if peak_day else 0,
         # New fields
         "weekly_peak_days": weekly_peak_days[-12:],  # Last 12 weeks
@@ -356,8 +362,6 @@ def get_temporal_trends(token: str) -> dict:
         "daily": Counter()
     })
     
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    
     for event in watch_events:
         ts = event.get("timestamp_local") or event.get("timestamp_utc")
         hour = event.get("hour_local")
@@ -369,7 +373,7 @@ def get_temporal_trends(token: str) -> dict:
         try:
             # Parse year-month
             if "T" in ts:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(ts)
             else:
                 dt = datetime.strptime(ts[:10], "%Y-%m-%d")
             
@@ -382,7 +386,7 @@ def get_temporal_trends(token: str) -> dict:
             
             if dow is not None:
                 monthly_data[month_key]["daily"][dow] += 1
-        except:
+        except (ValueError, TypeError):
             continue
     
     # Build monthly stats
@@ -407,7 +411,7 @@ def get_temporal_trends(token: str) -> dict:
         peak_day_count = 0
         if data["daily"]:
             peak_day = max(data["daily"].keys(), key=lambda d: data["daily"][d])
-            peak_day_name = day_names[peak_day]
+            peak_day_name = DAY_NAMES[peak_day]
             peak_day_count = data["daily"][peak_day]
         
         # Format peak hour label
@@ -663,13 +667,13 @@ def get_behavior_anomalies(token: str) -> dict:
         hour = e.get("hour_local")
         if ts and hour is not None:
             try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(ts)
                 date_str = dt.strftime("%Y-%m-%d")
                 if date_str not in daily_data:
                     daily_data[date_str] = {"hours": Counter(), "total": 0}
                 daily_data[date_str]["hours"][hour] += 1
                 daily_data[date_str]["total"] += 1
-            except:
+            except (ValueError, TypeError):
                 pass
     
     # Calculate average daily watches
@@ -717,13 +721,13 @@ def get_behavior_anomalies(token: str) -> dict:
         hour = e.get("hour_local")
         if ts and hour is not None:
             try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(ts)
                 year, week, _ = dt.isocalendar()
                 key = (year, week)
                 if key not in weekly_patterns:
                     weekly_patterns[key] = Counter()
                 weekly_patterns[key][hour] += 1
-            except:
+            except (ValueError, TypeError):
                 pass
     
     # Find weeks with unusual late-night activity
@@ -976,7 +980,7 @@ def get_habit_formation(token: str, min_streak_days: int = 3) -> dict:
         # Extract date
         try:
             date_str = ts.split("T")[0] if "T" in ts else ts[:10]
-        except:
+        except (ValueError, TypeError):
             continue
         
         # Track channel
@@ -1028,7 +1032,7 @@ def get_habit_formation(token: str, min_streak_days: int = 3) -> dict:
                             "days": len(current_streak)
                         })
                     current_streak = [sorted_dates[i]]
-            except:
+            except (ValueError, TypeError):
                 current_streak = [sorted_dates[i]]
         
         # Don't forget the last streak
@@ -1178,11 +1182,11 @@ def get_time_spent(token: str, break_threshold_minutes: int = 60, last_video_min
             if ts:
                 try:
                     if "T" in ts:
-                        dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                        dt = datetime.fromisoformat(ts)
                     else:
                         dt = datetime.strptime(ts[:19], "%Y-%m-%dT%H:%M:%S")
                     watch_events.append({"timestamp": dt, "event": e})
-                except:
+                except (ValueError, TypeError):
                     pass
     
     if not watch_events:
@@ -1352,12 +1356,12 @@ def get_channel_distribution(token: str) -> dict:
         
         try:
             if isinstance(ts, str):
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(ts)
             else:
                 continue
             month_key = f"{dt.year}-{dt.month:02d}"
             monthly_data[month_key][bin_label] += 1
-        except:
+        except (ValueError, TypeError):
             continue
     
     # Convert to sorted list
@@ -0,0 +1,36 @@
+"""
+Shared JSON helpers
+Uses orjson when available for fast parsing of large history files,
+with a stdlib fallback so the dependency stays optional.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """
+    Parse JSON from a str or bytes payload.
+
+    orjson parses both natively and is several times faster than the
+    stdlib on the large watch/search history arrays.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dump_bytes(obj, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, optionally pretty-printed.
+
+    Returned as bytes so callers can write in binary mode without an
+    extra encode pass.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -21,15 +21,18 @@ Pipeline:
 """
 
 import re
+import sys
 import unicodedata
-from typing import List, Dict, Set, Optional, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Dict, Set, Optional, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # =========================================================
 # STOPWORDS
 # =========================================================
 
-ENGLISH_STOPWORDS = {
+ENGLISH_STOPWORDS = frozenset({
     "a", "an", "the", "is", "are", "was", "were", "be", "been", "being",
     "have", "has", "had", "do", "does", "did", "will", "would", "could",
     "should", "may", "might", "must", "shall", "can", "need", "dare",
@@ -50,16 +53,16 @@ ENGLISH_STOPWORDS = {
     "watch", "watched", "new", "first", "last", "best", "top", "full",
     "part", "episode", "ep", "vs", "ft", "feat", "official", "exclusive",
     "shorts", "short", "movie", "clip", "scene", "trailer", "teaser"
-}
+})
 
-HINDI_STOPWORDS = {
+HINDI_STOPWORDS = frozenset({
     "का", "के", "की", "है", "हैं", "था", "थे", "थी", "में", "से", "को",
     "पर", "ने", "और", "या", "एक", "यह", "वह", "इस", "उस", "जो", "तो",
     "भी", "कर", "हो", "ही", "अब", "जब", "तक", "बहुत", "कुछ", "सब",
     "कोई", "किसी", "अपने", "उनके", "इनके", "वाले", "वाली", "वाला"
-}
+})
 
-WEAK_NOUNS = {
+WEAK_NOUNS = frozenset({
     "man", "men", "woman", "women", "person", "people", "guy", "guys",
     "leader", "leaders", "member", "members", "player", "players",
     "team", "teams", "group", "groups", "family", "families",
@@ -75,7 +78,7 @@ WEAK_NOUNS = {
     "view", "views", "like", "likes", "comment", "comments",
     "reaction", "reactions", "highlight", "highlights",
     "moment", "moments", "episode", "episodes"
-}
+})
 
 # =========================================================
 # LAZY MODEL LOADING
@@ -140,14 +143,29 @@ def remove_stopwords(text: str, stopwords: Set[str]) -> str:
     return ' '.join(filtered)
 
 
+# Zero-width / directional characters deleted via str.translate
+_ZERO_WIDTH_TABLE = dict.fromkeys(
+    [*range(0x200b, 0x2010), *range(0x202a, 0x202f), 0xfeff]
+)
+
+# Devanagari runs and pipe separators both become a single space
+_DEVANAGARI_OR_PIPE = re.compile(r'[\u0900-\u097F|]+')
+
+
 def clean_text_v1(text: str) -> str:
-    """Clean text for Hinglish processing."""
-    text = remove_devanagari(text)
-    text = normalize_unicode(text)
-    text = remove_stopwords(text, ENGLISH_STOPWORDS)
-    text = re.sub(r'[|]+', ' ', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    """Clean text for Hinglish processing: one translate + one regex pass."""
+    text = unicodedata.normalize('NFC', text)
+    text = text.translate(_ZERO_WIDTH_TABLE)
+    text = _DEVANAGARI_OR_PIPE.sub(' ', text)
+    # split() collapses whitespace, so no separate \s+ pass is needed
+    return ' '.join(w for w in text.split() if w.lower() not in ENGLISH_STOPWORDS)
+
+
+# Patterns for sanitize_topic, compiled once (it runs per entity/noun)
+_HASHTAG_ARTIFACT = re.compile(r'\.?#\w*')
+_DASH_RUN = re.compile(r'[—–\-]+')
+_MULTI_SPACE = re.compile(r'\s+')
+_TOPIC_STRIP_CHARS = ' #@|[](){}.,!?:;"\'-_'
 
 
 def sanitize_topic(text: str) -> str:
@@ -160,19 +178,24 @@ def sanitize_topic(text: str) -> str:
     """
     if not text:
         return ""
-    
+
+    # Fast path: plain alphanumeric tokens (the vast majority of nouns)
+    # need no substitution, stripping, or space collapsing
+    if text.isalnum():
+        return text
+
     # Remove hashtag patterns (including attached ones like ".#history")
-    text = re.sub(r'\.?#\w*', '', text)
-    
+    text = _HASHTAG_ARTIFACT.sub('', text)
+
     # Replace em-dash and other dashes with space
-    text = re.sub(r'[—–\-]+', ' ', text)
-    
+    text = _DASH_RUN.sub(' ', text)
+
     # Remove leading/trailing punctuation and special chars
-    text = text.strip(' #@|[](){}.,!?:;"\'-_')
-    
+    text = text.strip(_TOPIC_STRIP_CHARS)
+
     # Collapse spaces
-    text = re.sub(r'\s+', ' ', text).strip()
-    
+    text = _MULTI_SPACE.sub(' ', text).strip()
+
     return text
 
 
@@ -180,59 +203,94 @@ def sanitize_topic(text: str) -> str:
 # HASHTAG EXTRACTION
 # =========================================================
 
-def extract_hashtags(text: str) -> List[str]:
-    """Extract hashtags from text. Returns list of hashtag values (without #)."""
-    if not text:
-        return []
-    
-    hashtags = re.findall(r'#(\w+)', text, re.IGNORECASE)
-    
+# No IGNORECASE: \w is already case-insensitive and the flag forces the
+# engine through its case-folding path on every character
+# \w alone splits Devanagari tags at the vowel signs (combining marks
+# are not word characters), so the class includes the Devanagari block
+# explicitly and #\u0939\u093f\u0902\u0926\u0940-style tags come out whole
+HASHTAG_PATTERN = re.compile(r'#([\w\u0900-\u097F]+)')
+
+
+@lru_cache(maxsize=1 << 14)
+def _extract_hashtags_cached(text: str) -> Tuple[str, ...]:
+    """Cached core of extract_hashtags; tuples keep the cached value immutable."""
     seen = set()
     result = []
-    for tag in hashtags:
-        tag_lower = tag.lower()
+    for match in HASHTAG_PATTERN.finditer(text):
+        # Intern: the same tags recur across thousands of events, so shared
+        # string objects shrink memory and make equality checks pointer-fast
+        tag_lower = sys.intern(match.group(1).lower())
         if tag_lower not in seen and len(tag_lower) >= 2:
             result.append(tag_lower)
             seen.add(tag_lower)
-    
-    return result
+
+    return tuple(result)
+
+
+def extract_hashtags(text: str) -> List[str]:
+    """
+    Extract hashtags from text. Returns list of hashtag values (without #).
+
+    Rewatched videos repeat titles verbatim, so results are memoized;
+    each caller gets a fresh list built from the cached tuple.
+    """
+    if not text:
+        return []
+    return list(_extract_hashtags_cached(text))
 
 
 # =========================================================
 # BATCH PROCESSING FOR SPACY
 # =========================================================
 
-def process_texts_batch_english(texts: List[str], batch_size: int = 100) -> List[Tuple[List[str], List[str]]]:
+def process_texts_batch_english(texts: Iterable[str], batch_size: int = 100) -> List[Tuple[List[str], List[str]]]:
     """
     Process multiple texts through spaCy using nlp.pipe() for efficiency.
-    
+
+    Accepts any iterable (list or generator). Feeding nlp.pipe a generator
+    lets spaCy tokenize and infer on earlier batches while upstream code is
+    still producing text, instead of waiting on a fully materialized list.
+
     Returns list of (ner_list, noun_list) tuples, one per input text.
     5-10x faster than processing individually.
     """
     nlp = get_spacy_english_md()
     if nlp is None:
         return [([], []) for _ in texts]
-    
-    # Filter out None/empty texts and track indices
+
+    # Results for all texts (including empty ones); valid_indices maps each
+    # doc coming back from nlp.pipe to its position in the input stream.
+    # Histories repeat titles heavily (rewatches), so only the first
+    # occurrence of each text goes through the model; dup_of records
+    # (duplicate, first occurrence) index pairs to backfill afterwards.
+    results = []
     valid_indices = []
-    valid_texts = []
-    for i, text in enumerate(texts):
-        if text and isinstance(text, str) and text.strip():
-            valid_indices.append(i)
-            valid_texts.append(text)
-    
-    # Initialize results for all texts (including empty ones)
-    results = [([], []) for _ in texts]
-    
-    if not valid_texts:
-        return results
-    
+    dup_of = []
+
+    def valid_text_stream():
+        first_seen = {}
+        for i, text in enumerate(texts):
+            results.append(([], []))
+            if text and isinstance(text, str) and text.strip():
+                first = first_seen.get(text)
+                if first is not None:
+                    dup_of.append((i, first))
+                else:
+                    first_seen[text] = i
+                    valid_indices.append(i)
+                    yield text
+
     target_labels = {"PERSON", "ORG", "GPE", "LOC", "EVENT", "NORP", "FAC", "PRODUCT", "WORK_OF_ART"}
-    
+
+    # Only the tagger (for pos_) and NER are read below; skip the parser
+    # and lemmatizer entirely instead of computing results nobody uses
+    unused = [name for name in ("parser", "lemmatizer") if name in nlp.pipe_names]
+
     # Use nlp.pipe for batch processing on valid texts only
-    for idx, doc in enumerate(nlp.pipe(valid_texts, batch_size=batch_size)):
+    for idx, doc in enumerate(nlp.pipe(valid_text_stream(), batch_size=batch_size,
+                                       disable=unused)):
         original_idx = valid_indices[idx]
-        
+
         # Extract NER
         ner = []
         ner_seen = set()
@@ -240,7 +298,7 @@ def process_texts_batch_english(texts: List[str], batch_size: int = 100) -> List
             if ent.label_ in target_labels:
                 ent_text = sanitize_topic(ent.text).lower()
                 if ent_text and ent_text not in ner_seen and len(ent_text) >= 2:
-                    ner.append(ent_text)
+                    ner.append(sys.intern(ent_text))
                     ner_seen.add(ent_text)
         
         # Create protected set from NER
@@ -268,11 +326,17 @@ def process_texts_batch_english(texts: List[str], batch_size: int = 100) -> List
                 if noun_text in WEAK_NOUNS and noun_text not in protected:
                     continue
                 
-                nouns.append(noun_text)
+                nouns.append(sys.intern(noun_text))
                 noun_seen.add(noun_text)
         
         results[original_idx] = (ner, nouns)
     
+    # Duplicates never reached the model; copy from the first occurrence
+    # (fresh lists, since callers may attach these to distinct events)
+    for dup_index, first_index in dup_of:
+        ner, nouns = results[first_index]
+        results[dup_index] = (list(ner), list(nouns))
+    
     return results
 
 
@@ -280,50 +344,80 @@ def process_texts_batch_english(texts: List[str], batch_size: int = 100) -> List
 # HINDI PIPELINE (Stanza) - Not batched (used less frequently)
 # =========================================================
 
+def _collect_hindi_topics(doc) -> Tuple[List[str], List[str]]:
+    """Extract (ner_list, noun_list) from a processed Stanza document."""
+    # NER
+    ner = []
+    ner_seen = set()
+    for sentence in doc.sentences:
+        for ent in sentence.ents:
+            ent_text = sanitize_topic(ent.text).lower()
+            if ent_text and ent_text not in ner_seen and len(ent_text) >= 2:
+                ner.append(sys.intern(ent_text))
+                ner_seen.add(ent_text)
+
+    # Nouns
+    nouns = []
+    noun_seen = set()
+    for sentence in doc.sentences:
+        for word in sentence.words:
+            if word.upos in ("NOUN", "PROPN"):
+                noun_text = sanitize_topic(word.text).lower()
+                if (noun_text and
+                    noun_text not in noun_seen and
+                    len(noun_text) >= 2 and
+                    noun_text not in HINDI_STOPWORDS):
+                    nouns.append(sys.intern(noun_text))
+                    noun_seen.add(noun_text)
+
+    return ner, nouns
+
+
 def process_hindi_text(text: str) -> Tuple[List[str], List[str]]:
     """Process Hindi text through Stanza. Returns (ner_list, noun_list)."""
     if not text:
         return [], []
-    
+
     stanza_pipeline = get_stanza_hindi()
     if stanza_pipeline is None:
         return [], []
-    
+
     text = normalize_unicode(text)
-    
+
     try:
         doc = stanza_pipeline(text)
-        
-        # NER
-        ner = []
-        ner_seen = set()
-        for sentence in doc.sentences:
-            for ent in sentence.ents:
-                ent_text = sanitize_topic(ent.text)
-                if ent_text and ent_text not in ner_seen and len(ent_text) >= 2:
-                    ner.append(ent_text)
-                    ner_seen.add(ent_text)
-        
-        # Nouns
-        nouns = []
-        noun_seen = set()
-        for sentence in doc.sentences:
-            for word in sentence.words:
-                if word.upos in ("NOUN", "PROPN"):
-                    noun_text = sanitize_topic(word.text)
-                    if (noun_text and 
-                        noun_text not in noun_seen and 
-                        len(noun_text) >= 2 and
-                        noun_text not in HINDI_STOPWORDS):
-                        nouns.append(noun_text)
-                        noun_seen.add(noun_text)
-        
-        return ner, nouns
+        return _collect_hindi_topics(doc)
     except Exception as e:
         print(f"[ERROR] Hindi processing failed: {e}")
         return [], []
 
 
+def process_hindi_texts_batch(texts: List[str]) -> List[Tuple[List[str], List[str]]]:
+    """
+    Process multiple Hindi texts through Stanza in one bulk call.
+
+    Passing a list of Documents lets Stanza batch the neural models across
+    texts instead of paying per-call overhead, which is where most of the
+    per-title latency went.
+    """
+    if not texts:
+        return []
+
+    stanza_pipeline = get_stanza_hindi()
+    if stanza_pipeline is None:
+        return [([], []) for _ in texts]
+
+    try:
+        import stanza
+        docs = stanza_pipeline(
+            [stanza.Document([], text=normalize_unicode(t)) for t in texts]
+        )
+        return [_collect_hindi_topics(doc) for doc in docs]
+    except Exception as e:
+        print(f"[ERROR] Hindi batch processing failed: {e}")
+        return [process_hindi_text(t) for t in texts]
+
+
 # =========================================================
 # NER SUBSUMPTION
 # =========================================================
@@ -332,21 +426,13 @@ def apply_ner_subsumption(all_topics: List[str], ner_entities: List[str]) -> Lis
     """
     FIX 1: If a multi-word NER exists, drop its unigram components.
     Example: If "greg biffle" in topics -> drop "greg" and "biffle"
+
+    Inputs are expected to be lowercased already (call sites enforce this).
     """
-    subsumed = set()
-    for entity in ner_entities:
-        words = entity.split()
-        if len(words) > 1:
-            for word in words:
-                subsumed.add(word.lower())
-    
-    filtered = []
-    for topic in all_topics:
-        topic_lower = topic.lower()
-        if ' ' in topic_lower or topic_lower not in subsumed:
-            filtered.append(topic)
-    
-    return filtered
+    subsumed = {w for e in ner_entities if ' ' in e for w in e.split()}
+    if not subsumed:
+        return all_topics
+    return [t for t in all_topics if ' ' in t or t not in subsumed]
 
 
 # =========================================================
@@ -359,47 +445,73 @@ def process_events_batch(events: List[Dict], batch_size: int = 100) -> List[Dict
     
     Uses spaCy's nlp.pipe() for 5-10x faster processing.
     """
-    # Filter qualifying events
+    # Filter qualifying events and route texts to the right pipeline in a
+    # single pass (appends bound to locals for the hot loop)
     qualifying_indices = []
-    texts_to_process = []
     language_types = []
-    
+    english_indices = []
+    english_items = []
+    hindi_indices = []
+    hindi_texts = []
+
+    add_qualifying = qualifying_indices.append
+    add_language = language_types.append
+    add_english_index = english_indices.append
+    add_english_item = english_items.append
+    add_hindi_index = hindi_indices.append
+    add_hindi_text = hindi_texts.append
+
     for i, event in enumerate(events):
-        if event.get("type") == "watch" and event.get("engagement") == "active":
-            text_clean = event.get("text_clean", "")
-            lang = event.get("language_type", "").lower()
-            
-            if lang == "hinglish":
-                # For hinglish, clean the text first
-                text_v1 = clean_text_v1(text_clean)
-                event["text_v1"] = text_v1
-                texts_to_process.append(text_v1 if text_v1 else "")
-            elif lang == "hindi":
-                texts_to_process.append("")  # Will process separately
-            else:
-                texts_to_process.append(text_clean)
-            
-            qualifying_indices.append(i)
-            language_types.append(lang)
-    
+        if event.get("type") != "watch" or event.get("engagement") != "active":
+            continue
+
+        text_clean = event.get("text_clean", "")
+        lang = event.get("language_type", "").lower()
+
+        if lang == "hindi":
+            # Processed through the Stanza queue below
+            add_hindi_index(len(qualifying_indices))
+            add_hindi_text(text_clean)
+        elif lang in ("english", "hinglish", "unknown", ""):
+            add_english_index(len(qualifying_indices))
+            add_english_item((i, lang, text_clean))
+
+        add_qualifying(i)
+        add_language(lang)
+
     total = len(qualifying_indices)
     print(f"[TOPIC] Processing {total} qualifying events...")
-    
+
     if total == 0:
         return events
-    
-    # Batch process English/Hinglish texts through spaCy
-    english_indices = []
-    english_texts = []
-    
-    for idx, (i, lang) in enumerate(zip(qualifying_indices, language_types)):
-        if lang in ("english", "hinglish", "unknown", ""):
-            english_indices.append(idx)
-            english_texts.append(texts_to_process[idx])
-    
-    print(f"[TOPIC] Batch processing {len(english_texts)} English/Hinglish texts...")
-    english_results = process_texts_batch_english(english_texts, batch_size)
-    
+
+    def english_text_stream():
+        # Hinglish cleaning runs lazily here, overlapped with spaCy
+        # inference on earlier batches; text_v1 is stored as a side effect
+        # before the result loop below reads it
+        for i, lang, text_clean in english_items:
+            if lang == "hinglish":
+                text_v1 = clean_text_v1(text_clean)
+                events[i]["text_v1"] = text_v1
+                yield text_v1 if text_v1 else ""
+            else:
+                yield text_clean
+
+    # Batch process English/Hinglish texts through spaCy; Hindi texts run
+    # through Stanza in a worker thread so the two queues overlap instead
+    # of serializing on the critical path
+    print(f"[TOPIC] Batch processing {len(english_items)} English/Hinglish texts...")
+    hindi_result_map = {}
+
+    if hindi_texts:
+        print(f"[TOPIC] Prefetching {len(hindi_texts)} Hindi texts concurrently...")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            hindi_future = pool.submit(process_hindi_texts_batch, hindi_texts)
+            english_results = process_texts_batch_english(english_text_stream(), batch_size)
+            hindi_result_map = dict(zip(hindi_indices, hindi_future.result()))
+    else:
+        english_results = process_texts_batch_english(english_text_stream(), batch_size)
+
     # Map results back
     english_result_map = {}
     for idx, result in zip(english_indices, english_results):
@@ -417,7 +529,7 @@ def process_events_batch(events: List[Dict], batch_size: int = 100) -> List[Dict
         
         # Get NER and nouns based on language
         if lang == "hindi":
-            ner, nouns = process_hindi_text(text_clean)
+            ner, nouns = hindi_result_map.get(idx, ([], []))
         else:
             # Get from batch results
             ner, nouns = english_result_map.get(idx, ([], []))
@@ -526,12 +638,20 @@ def get_aggregated_topics(events: List[Dict], top_n: int = 50) -> Dict:
     ner_counter = Counter()
     noun_counter = Counter()
     topic_counter = Counter()
-    
+
+    # Single pass over events; bind the update methods once to avoid
+    # repeated attribute lookups in the hot loop.
+    hashtag_update = hashtag_counter.update
+    ner_update = ner_counter.update
+    noun_update = noun_counter.update
+    topic_update = topic_counter.update
+
     for event in events:
-        hashtag_counter.update(event.get("hashtags", []))
-        ner_counter.update(event.get("ner", []))
-        noun_counter.update(event.get("nouns", []))
-        topic_counter.update(event.get("micro_topics", []))
+        get = event.get
+        hashtag_update(get("hashtags", ()))
+        ner_update(get("ner", ()))
+        noun_update(get("nouns", ()))
+        topic_update(get("micro_topics", ()))
     
     return {
         "top_hashtags": [{"topic": t, "count": c} for t, c in hashtag_counter.most_common(top_n)],
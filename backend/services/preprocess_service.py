@@ -7,90 +7,138 @@ import re
 import json
 import csv
 import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 import pytz
 
-from services.language_service import detect_language
+from services.language_service import detect_language, detect_language_batch
+from services.json_io import json_loads
 
+# Optional streaming JSON parser. When installed, history arrays are
+# iterated entry-by-entry instead of materialized whole, which halves
+# peak memory on large takeouts. Absent, we fall back to one-shot parsing.
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-def clean_text(text: str) -> str:
+
+# Title prefixes added by Takeout, built once instead of per call
+TITLE_PREFIXES = (
+    "Watched ", "Viewed ", "Searched for ",
+    "watched ", "viewed ", "searched for "
+)
+
+# URL pattern, compiled once
+URL_PATTERN = re.compile(r'https?://\S+')
+
+# Emoji codepoint ranges, covering the actual emoji Unicode blocks. The
+# previous version included a \U000024C2-\U0001F251 catch-all that swallowed
+# CJK and other non-emoji scripts along the way; these compact ranges cover
+# the emoji planes without collateral damage.
+EMOJI_RANGES = (
+    (0x2300, 0x23FF),    # misc technical (watch, hourglass, etc.)
+    (0x24C2, 0x24C2),    # circled M
+    (0x2600, 0x27BF),    # misc symbols + dingbats
+    (0x2B00, 0x2BFF),    # arrows, stars
+    (0x3030, 0x3030),    # wavy dash
+    (0x303D, 0x303D),    # part alternation mark
+    (0x3297, 0x3297),    # circled ideographs
+    (0x3299, 0x3299),
+    (0xFE0F, 0xFE0F),    # variation selector-16
+    (0x1F000, 0x1FAFF),  # pictographs, emoticons, transport, flags,
+                         # supplemental symbols, extended-A
+)
+
+# Fused translation table for clean_text: one str.translate pass deletes
+# emoji codepoints and lowercases ASCII letters at the same time
+_CLEAN_TABLE = {cp: None for lo, hi in EMOJI_RANGES for cp in range(lo, hi + 1)}
+_CLEAN_TABLE.update({cp: cp + 32 for cp in range(0x41, 0x5B)})
+
+
+def clean_text(text: str, strip_prefix: bool = True) -> str:
     """
     Clean text by:
     - Removing prefixes (Watched, Viewed, Searched for)
     - Lowercasing
     - Removing emojis
     - Removing URLs
+
+    Callers that already stripped the prefix pass strip_prefix=False to
+    skip that scan.
     """
     if not text:
         return ""
-    
+
     # Remove common prefixes
-    prefixes = [
-        "Watched ", "Viewed ", "Searched for ",
-        "watched ", "viewed ", "searched for "
-    ]
-    for prefix in prefixes:
-        if text.startswith(prefix):
-            text = text[len(prefix):]
-            break
-    
+    if strip_prefix:
+        for prefix in TITLE_PREFIXES:
+            if text.startswith(prefix):
+                text = text[len(prefix):]
+                break
+
     # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
-    
-    # Remove emojis (Unicode emoji ranges)
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "]+",
-        flags=re.UNICODE
-    )
-    text = emoji_pattern.sub('', text)
-    
-    # Lowercase and strip
-    text = text.lower().strip()
-    
-    return text
+    text = URL_PATTERN.sub('', text)
 
+    # Pure-ASCII titles (the common case) cannot contain emoji, so a
+    # single lowercase pass finishes the job
+    if text.isascii():
+        return text.lower().strip()
 
-def parse_timestamp(time_str: str) -> Optional[str]:
-    """Parse YouTube timestamp to ISO format (UTC)"""
+    # Fused pass: drop emoji and lowercase ASCII letters in one
+    # str.translate; lower() then handles any cased non-ASCII letters
+    return text.translate(_CLEAN_TABLE).lower().strip()
+
+
+def parse_timestamp_dt(time_str: Optional[str]) -> Optional[datetime]:
+    """Parse a YouTube timestamp to a naive UTC datetime, or None.
+
+    fromisoformat is a single C-level parse that accepts all the variants
+    Takeout emits (with/without fraction, trailing Z or explicit offset).
+    """
     if not time_str:
         return None
-    
+
     try:
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%dT%H:%M:%S",
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(time_str, fmt)
-                return dt.isoformat() + "Z"
-            except ValueError:
-                continue
-        
-        return time_str
-    except Exception:
+        dt = datetime.fromisoformat(time_str)
+    except (ValueError, TypeError):
         return None
 
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(pytz.UTC).replace(tzinfo=None)
 
-def convert_to_local_time(utc_time_str: str, timezone_str: str) -> dict:
+    return dt
+
+
+def parse_timestamp(time_str: Optional[str]) -> Optional[str]:
+    """Parse YouTube timestamp to ISO format (UTC)"""
+    if not time_str:
+        return None
+
+    dt = parse_timestamp_dt(time_str)
+    if dt is None:
+        # Unparseable strings pass through untouched
+        return time_str if isinstance(time_str, str) else None
+
+    return dt.isoformat() + "Z"
+
+
+@lru_cache(maxsize=None)
+def _get_timezone(timezone_str: str):
+    """Cache pytz timezone objects; building one reads the IANA database."""
+    return pytz.timezone(timezone_str)
+
+
+def convert_dt_to_local(dt_utc: Optional[datetime], timezone_str: str) -> dict:
     """
-    Convert UTC timestamp to local timezone and extract time components.
-    
+    Convert an already-parsed naive UTC datetime to local time components.
+
     Args:
-        utc_time_str: ISO format UTC timestamp (ending with Z)
+        dt_utc: Naive UTC datetime (from parse_timestamp_dt), or None
         timezone_str: Timezone string like "Asia/Kolkata"
-    
+
     Returns:
         Dict with timestamp_local, hour_local, day_of_week, month_local, or all None if conversion fails
     """
@@ -100,57 +148,50 @@ def convert_to_local_time(utc_time_str: str, timezone_str: str) -> dict:
         "day_of_week": None,
         "month_local": None
     }
-    
-    if not utc_time_str or not timezone_str:
+
+    if dt_utc is None or not timezone_str:
         return result
-    
+
     try:
-        # Parse UTC time
-        utc_time_str = utc_time_str.rstrip('Z')
-        
-        # Try different formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%dT%H:%M:%S",
-        ]
-        
-        dt_utc = None
-        for fmt in formats:
-            try:
-                dt_utc = datetime.strptime(utc_time_str, fmt)
-                break
-            except ValueError:
-                continue
-        
-        if dt_utc is None:
-            return result
-        
-        # Make it timezone-aware (UTC)
-        dt_utc = pytz.UTC.localize(dt_utc)
-        
-        # Convert to target timezone
-        target_tz = pytz.timezone(timezone_str)
-        dt_local = dt_utc.astimezone(target_tz)
-        
-        # Extract components
-        result["timestamp_local"] = dt_local.isoformat()
-        result["hour_local"] = dt_local.hour  # 0-23
-        result["day_of_week"] = dt_local.weekday()  # 0=Monday, 6=Sunday
-        result["month_local"] = dt_local.month  # 1-12
-        
-        return result
-        
+        # Convert to target timezone (cached: one tzfile read per timezone,
+        # not one per event)
+        target_tz = _get_timezone(timezone_str)
+        dt_local = pytz.UTC.localize(dt_utc).astimezone(target_tz)
     except Exception:
-        return None
+        return result
+
+    # Extract components
+    result["timestamp_local"] = dt_local.isoformat()
+    result["hour_local"] = dt_local.hour  # 0-23
+    result["day_of_week"] = dt_local.weekday()  # 0=Monday, 6=Sunday
+    result["month_local"] = dt_local.month  # 1-12
+
+    return result
+
+
+def convert_to_local_time(utc_time_str: str, timezone_str: str) -> dict:
+    """
+    Convert UTC timestamp to local timezone and extract time components.
+
+    Args:
+        utc_time_str: ISO format UTC timestamp (ending with Z)
+        timezone_str: Timezone string like "Asia/Kolkata"
+
+    Returns:
+        Dict with timestamp_local, hour_local, day_of_week, month_local, or all None if conversion fails
+    """
+    if not utc_time_str or not timezone_str:
+        return convert_dt_to_local(None, timezone_str)
+
+    return convert_dt_to_local(parse_timestamp_dt(utc_time_str), timezone_str)
 
 
 def is_google_ads(entry: dict) -> bool:
     """Check if entry is from Google Ads"""
-    details = entry.get("details", [])
-    for detail in details:
-        if detail.get("name") == "From Google Ads":
-            return True
-    return False
+    return any(
+        detail.get("name") == "From Google Ads"
+        for detail in entry.get("details", ())
+    )
 
 
 def is_youtube_post(entry: dict) -> bool:
@@ -161,6 +202,20 @@ def is_youtube_post(entry: dict) -> bool:
     return False
 
 
+def _skip_entry(entry: dict) -> bool:
+    """Combined ad/post filter for the build loop.
+
+    The substring check on titleUrl is the cheapest signal, so it runs
+    first; the details scan only happens for the few entries that pass.
+    """
+    if "/post/" in entry.get("titleUrl", ""):
+        return True
+    return any(
+        detail.get("name") == "From Google Ads"
+        for detail in entry.get("details", ())
+    )
+
+
 def get_engagement(title: str) -> str:
     """Determine engagement type from title prefix"""
     if not title:
@@ -186,22 +241,61 @@ def enrich_event_with_language(event: dict) -> dict:
     return event
 
 
-def enrich_event_with_local_time(event: dict, timezone: str) -> dict:
-    """Add local timestamp and time components to an event."""
-    timestamp_utc = event.get("timestamp_utc")
-    
-    time_data = convert_to_local_time(timestamp_utc, timezone)
+def _apply_language_batch(events: list[dict]) -> None:
+    """Fill language fields for all events with one batched detection call."""
+    if not events:
+        return
+
+    texts = [event["text_clean"] or "" for event in events]
+    for event, (lang_type, confidence) in zip(events, detect_language_batch(texts)):
+        event["language_type"] = lang_type
+        event["language_confidence"] = confidence
+
+
+def enrich_event_with_local_time(event: dict, timezone: str,
+                                 dt_utc: Optional[datetime] = None) -> dict:
+    """Add local timestamp and time components to an event.
+
+    Pass dt_utc when the UTC timestamp has already been parsed so the
+    event's timestamp string is not parsed a second time.
+    """
+    if dt_utc is None:
+        time_data = convert_to_local_time(event.get("timestamp_utc"), timezone)
+    else:
+        time_data = convert_dt_to_local(dt_utc, timezone)
+
     event["timestamp_local"] = time_data["timestamp_local"]
     event["hour_local"] = time_data["hour_local"]
     event["day_of_week"] = time_data["day_of_week"]
     event["month_local"] = time_data["month_local"]
-    
+
     return event
 
 
-def preprocess_watch_history(content: str, timezone: str = "UTC") -> list[dict]:
+def _iter_history_entries(content: bytes | str):
+    """
+    Yield raw entries of a takeout history JSON array one at a time.
+
+    With ijson installed and bytes input, entries stream straight off the
+    buffer so the whole array is never materialized. Otherwise the array
+    is parsed in one shot and iterated. Raises on malformed payloads.
+    """
+    if ijson is not None and isinstance(content, (bytes, bytearray)):
+        yield from ijson.items(io.BytesIO(content), 'item')
+        return
+
+    data = json_loads(content)
+    if not isinstance(data, list):
+        raise ValueError("expected a JSON array of history entries")
+    yield from data
+
+
+def preprocess_watch_history(content: bytes | str, timezone: str = "UTC") -> list[dict]:
     """
     Process watch-history.json into normalized Event format.
+
+    Accepts the raw file as bytes (preferred: orjson parses bytes natively,
+    skipping a whole-file UTF-8 decode) or as an already-decoded string.
     
     Rules:
     1. Drop Google Ads entries
@@ -213,85 +307,83 @@ def preprocess_watch_history(content: str, timezone: str = "UTC") -> list[dict]:
     7. Convert timestamp to local
     """
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
-        return []
-    
-    if not isinstance(data, list):
+        # Comprehension rather than an append loop: CPython pre-sizes the
+        # list and uses the LIST_APPEND fast path
+        events = [
+            _build_watch_event(entry, timezone)
+            for entry in _iter_history_entries(content)
+            if not _skip_entry(entry)
+        ]
+    except Exception:
+        # Malformed payload from either parser: keep the old all-or-nothing
+        # contract and return no events
         return []
+
+    # Language detection in one batch pass (deduped inside the batch API)
+    _apply_language_batch(events)
+
+    return events
+
+
+def _build_watch_event(entry: dict, timezone: str) -> dict:
+    """Build one normalized watch event from a raw history entry."""
+    title = entry.get("title", "")
+
+    # Determine engagement
+    engagement = get_engagement(title)
+
+    # Strip the "Watched"/"Viewed" prefix once; everything downstream
+    # works on the already-stripped text
+    text_raw = title.removeprefix("Watched ").removeprefix("Viewed ")
+
+    # Clean title text (prefix already gone)
+    text_clean = clean_text(text_raw, strip_prefix=False)
+    
+    # Extract channel info from subtitles
+    channel = None
+    channel_url = None
+    subtitles = entry.get("subtitles", [])
+    if subtitles and len(subtitles) > 0:
+        channel = subtitles[0].get("name")
+        channel_url = subtitles[0].get("url")
+    
+    # Get video URL from titleUrl
+    video_url = entry.get("titleUrl")
+
+    # Get timestamp (parsed once; the datetime is reused for local time)
+    time_str = entry.get("time")
+    dt_utc = parse_timestamp_dt(time_str)
+    if dt_utc is not None:
+        timestamp_utc = dt_utc.isoformat() + "Z"
+    else:
+        timestamp_utc = time_str if isinstance(time_str, str) and time_str else None
     
-    events = []
-    
-    for entry in data:
-        # Skip Google Ads
-        if is_google_ads(entry):
-            continue
-        
-        # Skip YouTube posts
-        if is_youtube_post(entry):
-            continue
-        
-        title = entry.get("title", "")
-        
-        # Determine engagement
-        engagement = get_engagement(title)
-        
-        # Get raw text (after removing "Watched" prefix)
-        text_raw = title
-        for prefix in ["Watched ", "Viewed "]:
-            if text_raw.startswith(prefix):
-                text_raw = text_raw[len(prefix):]
-                break
-        
-        # Clean title text
-        text_clean = clean_text(title)
-        
-        # Extract channel info from subtitles
-        channel = None
-        channel_url = None
-        subtitles = entry.get("subtitles", [])
-        if subtitles and len(subtitles) > 0:
-            channel = subtitles[0].get("name")
-            channel_url = subtitles[0].get("url")
-        
-        # Get video URL from titleUrl
-        video_url = entry.get("titleUrl")
-        
-        # Get timestamp
-        timestamp_utc = parse_timestamp(entry.get("time"))
-        
-        event = {
-            "type": "watch",
-            "engagement": engagement,
-            "timestamp_utc": timestamp_utc,
-            "timestamp_local": None,
-            "hour_local": None,
-            "day_of_week": None,
-            "month_local": None,
-            "text_raw": text_raw if text_raw else None,
-            "text_clean": text_clean if text_clean else None,
-            "language_type": None,
-            "language_confidence": None,
-            "channel": channel,
-            "channel_clean": channel.lower() if channel else None,
-            "channel_url": channel_url,
-            "video_url": video_url
-        }
-        
-        # Enrich with language detection
-        event = enrich_event_with_language(event)
-        
-        # Enrich with local time
-        event = enrich_event_with_local_time(event, timezone)
-        
-        events.append(event)
+    event = {
+        "type": "watch",
+        "engagement": engagement,
+        "timestamp_utc": timestamp_utc,
+        "timestamp_local": None,
+        "hour_local": None,
+        "day_of_week": None,
+        "month_local": None,
+        "text_raw": text_raw if text_raw else None,
+        "text_clean": text_clean if text_clean else None,
+        "language_type": None,
+        "language_confidence": None,
+        "channel": channel,
+        "channel_clean": channel.lower() if channel else None,
+        "channel_url": channel_url,
+        "video_url": video_url
+    }
     
-    return events
+    # Enrich with local time (reusing the parsed datetime)
+    return enrich_event_with_local_time(event, timezone, dt_utc)
 
 
-def preprocess_search_history(content: str, timezone: str = "UTC") -> list[dict]:
+def preprocess_search_history(content: bytes | str, timezone: str = "UTC") -> list[dict]:
     """
     Process search-history.json into normalized Event format.
+    Accepts bytes or str like preprocess_watch_history.
     
     Rules:
     1. Extract timestamp from "time" field
@@ -300,39 +392,109 @@ def preprocess_search_history(content: str, timezone: str = "UTC") -> list[dict]
     4. Convert timestamp to local
     """
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
-        return []
-    
-    if not isinstance(data, list):
+        events = [
+            _build_search_event(entry, timezone)
+            for entry in _iter_history_entries(content)
+        ]
+    except Exception:
+        # Malformed payload from either parser: keep the old all-or-nothing
+        # contract and return no events
         return []
+
+    # Language detection in one batch pass (deduped inside the batch API)
+    _apply_language_batch(events)
+
+    return events
+
+
+def _build_search_event(entry: dict, timezone: str) -> dict:
+    """Build one normalized search event from a raw history entry."""
+    title = entry.get("title", "")
+
+    # Strip the "Searched for" prefix once and reuse the result
+    text_raw = title.removeprefix("Searched for ")
+
+    # Clean query text (prefix already gone)
+    text_clean = clean_text(text_raw, strip_prefix=False)
+
+    # Get timestamp (parsed once; the datetime is reused for local time)
+    time_str = entry.get("time")
+    dt_utc = parse_timestamp_dt(time_str)
+    if dt_utc is not None:
+        timestamp_utc = dt_utc.isoformat() + "Z"
+    else:
+        timestamp_utc = time_str if isinstance(time_str, str) and time_str else None
+
+    event = {
+        "type": "search",
+        "engagement": None,
+        "timestamp_utc": timestamp_utc,
+        "timestamp_local": None,
+        "hour_local": None,
+        "day_of_week": None,
+        "month_local": None,
+        "text_raw": text_raw if text_raw else None,
+        "text_clean": text_clean if text_clean else None,
+        "language_type": None,
+        "language_confidence": None,
+        "channel": None,
+        "channel_clean": None,
+        "channel_url": None,
+        "video_url": None
+    }
+
+    # Enrich with local time (reusing the parsed datetime)
+    return enrich_event_with_local_time(event, timezone, dt_utc)
+
+
+def preprocess_subscriptions(content: bytes | str, timezone: str = "UTC") -> list[dict]:
+    """
+    Process subscriptions.csv into normalized Event format.
+    Accepts bytes or str like preprocess_watch_history.
     
+    Rules:
+    1. "Channel Title" -> channel
+    2. "Channel Url" -> channel_url
+    3. No text field, so no language detection needed
+    """
     events = []
     
-    for entry in data:
-        title = entry.get("title", "")
-        
-        # Get raw text (after removing "Searched for" prefix)
-        text_raw = title
-        if text_raw.startswith("Searched for "):
-            text_raw = text_raw[len("Searched for "):]
-        
-        # Clean title - remove "Searched for" prefix
-        text_clean = clean_text(title)
-        
-        # Get timestamp
-        timestamp_utc = parse_timestamp(entry.get("time"))
-        
-        event = {
-            "type": "search",
+    try:
+        if isinstance(content, bytes):
+            # Decode lazily while the csv module reads, no full-string copy
+            stream = io.TextIOWrapper(io.BytesIO(content), encoding='utf-8')
+        else:
+            stream = io.StringIO(content)
+
+        # csv.reader + fixed column indices: no per-row dict construction
+        # and header hashing like DictReader does
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if not header:
+            return []
+
+        def column(name: str) -> int:
+            try:
+                return header.index(name)
+            except ValueError:
+                return -1
+
+        title_idx = column("Channel Title")
+        id_idx = column("Channel Id")
+        url_idx = column("Channel Url")
+
+        # Shared template: per-row events are shallow copies with only the
+        # channel fields filled in
+        template = {
+            "type": "subscribe",
             "engagement": None,
-            "timestamp_utc": timestamp_utc,
+            "timestamp_utc": None,
             "timestamp_local": None,
             "hour_local": None,
             "day_of_week": None,
             "month_local": None,
-            "text_raw": text_raw if text_raw else None,
-            "text_clean": text_clean if text_clean else None,
+            "text_raw": None,
+            "text_clean": None,
             "language_type": None,
             "language_confidence": None,
             "channel": None,
@@ -340,56 +502,22 @@ def preprocess_search_history(content: str, timezone: str = "UTC") -> list[dict]
             "channel_url": None,
             "video_url": None
         }
-        
-        # Enrich with language detection
-        event = enrich_event_with_language(event)
-        
-        # Enrich with local time
-        event = enrich_event_with_local_time(event, timezone)
-        
-        events.append(event)
-    
-    return events
 
-
-def preprocess_subscriptions(content: str, timezone: str = "UTC") -> list[dict]:
-    """
-    Process subscriptions.csv into normalized Event format.
-    
-    Rules:
-    1. "Channel Title" -> channel
-    2. "Channel Url" -> channel_url
-    3. No text field, so no language detection needed
-    """
-    events = []
-    
-    try:
-        reader = csv.DictReader(io.StringIO(content))
-        
         for row in reader:
-            channel = row.get("Channel Title") or row.get("Channel Id")
-            channel_url = row.get("Channel Url")
-            
-            event = {
-                "type": "subscribe",
-                "engagement": None,
-                "timestamp_utc": None,
-                "timestamp_local": None,
-                "hour_local": None,
-                "day_of_week": None,
-                "month_local": None,
-                "text_raw": None,
-                "text_clean": None,
-                "language_type": None,
-                "language_confidence": None,
-                "channel": channel,
-                "channel_clean": channel.lower() if channel else None,
-                "channel_url": channel_url,
-                "video_url": None
-            }
-            
+            row_len = len(row)
+            channel = (
+                (row[title_idx] if 0 <= title_idx < row_len else None)
+                or (row[id_idx] if 0 <= id_idx < row_len else None)
+            )
+            channel_url = row[url_idx] if 0 <= url_idx < row_len else None
+
+            event = template.copy()
+            event["channel"] = channel
+            event["channel_clean"] = channel.lower() if channel else None
+            event["channel_url"] = channel_url
+
             events.append(event)
-            
+
     except Exception:
         return []
     
@@ -402,6 +530,7 @@ def preprocess_all_files(files: list[dict], timezone: str = "UTC") -> dict:
     
     Args:
         files: List of extracted file dicts with 'filename' and 'content'
+            (content may be bytes or str)
         timezone: User's timezone for timestamp conversion
         
     Returns:
@@ -426,28 +555,34 @@ def preprocess_all_files(files: list[dict], timezone: str = "UTC") -> dict:
         }
     }
     
-    for file in files:
-        filename = file.get("filename", "")
-        content = file.get("content", "")
-        
-        if filename == "watch-history.json":
-            events = preprocess_watch_history(content, timezone)
-            results["watch_history"] = events
-            results["stats"]["total_watch"] = len(events)
-            results["combined_events"].extend(events)
-            
-        elif filename == "search-history.json":
-            events = preprocess_search_history(content, timezone)
-            results["search_history"] = events
-            results["stats"]["total_search"] = len(events)
-            results["combined_events"].extend(events)
-            
-        elif filename == "subscriptions.csv":
-            events = preprocess_subscriptions(content, timezone)
-            results["subscriptions"] = events
-            results["stats"]["total_subscribe"] = len(events)
+    # The three file types are independent, so process them concurrently.
+    # The heavy lifting (json parsing, regex subs) happens in C code that
+    # releases the GIL, so threads overlap the smaller files with the large
+    # watch history instead of queuing behind it.
+    known = {
+        "watch-history.json": (preprocess_watch_history, "watch_history", "total_watch"),
+        "search-history.json": (preprocess_search_history, "search_history", "total_search"),
+        "subscriptions.csv": (preprocess_subscriptions, "subscriptions", "total_subscribe"),
+    }
+
+    tasks = []
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for file in files:
+            dispatch = known.get(file.get("filename", ""))
+            if dispatch is None:
+                continue
+            fn, result_key, stat_key = dispatch
+            future = executor.submit(fn, file.get("content", ""), timezone)
+            tasks.append((future, result_key, stat_key))
+
+        # Collect in submission order so combined_events keeps the same
+        # layout the sequential loop produced
+        for future, result_key, stat_key in tasks:
+            events = future.result()
+            results[result_key] = events
+            results["stats"][stat_key] = len(events)
             results["combined_events"].extend(events)
-    
+
     # Calculate language breakdown
     for event in results["combined_events"]:
         lang = event.get("language_type", "unknown")
@@ -4,12 +4,13 @@ Handles storing and retrieving session data locally
 """
 
 import os
-import json
 import uuid
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
+from services.json_io import json_loads, json_dump_bytes
+
 
 # Storage directory for sessions
 STORAGE_DIR = Path(__file__).parent.parent / "storage"
@@ -25,6 +26,43 @@ def _get_session_path(token: str) -> Path:
     return STORAGE_DIR / f"{token}.json"
 
 
+# In-memory metadata index: token -> {token, files_stored, timezone,
+# created_at, path}. Built lazily from disk on first use, then kept current
+# by create/delete, so listing and cleanup stop re-reading every session
+# file. "path" is the file each entry was actually read from (the storage
+# dir also holds preprocessed_{token}.json files, whose names cannot be
+# rebuilt from the token alone); it stays internal and is stripped before
+# metadata leaves this module.
+_session_index: Optional[dict] = None
+
+
+def _get_session_index() -> dict:
+    """Return the session metadata index, scanning disk on first call."""
+    global _session_index
+
+    if _session_index is None:
+        _ensure_storage_dir()
+        index = {}
+        for session_file in STORAGE_DIR.glob("*.json"):
+            try:
+                with open(session_file, 'rb') as fh:
+                    data = json_loads(fh.read())
+            except (ValueError, IOError):
+                continue
+            token = data.get("token")
+            if token:
+                index[token] = {
+                    "token": token,
+                    "files_stored": [f["filename"] for f in data.get("files", [])],
+                    "timezone": data.get("timezone"),
+                    "created_at": data.get("created_at"),
+                    "path": str(session_file)
+                }
+        _session_index = index
+
+    return _session_index
+
+
 def create_session(files: list[dict], timezone: str) -> dict:
     """
     Create a new session and store files locally.
@@ -48,17 +86,43 @@ def create_session(files: list[dict], timezone: str) -> dict:
         "created_at": created_at
     }
     
-    # Save to file
+    # Save to file (serialized to bytes in one shot, written in binary mode).
+    # Write to a temp file then rename so a crash mid-write never leaves a
+    # truncated session behind; replace() is atomic on the same filesystem.
     session_path = _get_session_path(token)
-    with open(session_path, 'w', encoding='utf-8') as f:
-        json.dump(session_data, f, indent=2)
-    
-    return {
+    tmp_path = session_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(json_dump_bytes(session_data, indent=True))
+    tmp_path.replace(session_path)
+
+    metadata = {
         "token": token,
         "files_stored": [f["filename"] for f in files],
         "timezone": timezone,
         "created_at": created_at
     }
+    _get_session_index()[token] = {**metadata, "path": str(session_path)}
+
+    return metadata
+
+
+def register_session_file(session_path: Path, token: str,
+                          timezone: Optional[str], created_at: Optional[str],
+                          files_stored: Optional[list[str]] = None) -> None:
+    """
+    Record an externally written session file in the index.
+
+    Writers that store sessions under their own filenames (the preprocess
+    routes' preprocessed_{token}.json) call this right after the write so
+    list_sessions and cleanup_expired_sessions see the new session without
+    waiting for a process restart to rescan the storage dir.
+    """
+    _get_session_index()[token] = {
+        "token": token,
+        "files_stored": files_stored or [],
+        "timezone": timezone,
+        "created_at": created_at,
+        "path": str(session_path)
+    }
 
 
 def get_session(token: str) -> Optional[dict]:
@@ -77,9 +141,9 @@ def get_session(token: str) -> Optional[dict]:
         return None
     
     try:
-        with open(session_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(session_path, 'rb') as f:
+            return json_loads(f.read())
+    except (ValueError, IOError):
         return None
 
 
@@ -93,13 +157,17 @@ def delete_session(token: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    session_path = _get_session_path(token)
-    
+    index = _get_session_index()
+    meta = index.get(token)
+    session_path = Path(meta["path"]) if meta else _get_session_path(token)
+
     if not session_path.exists():
+        index.pop(token, None)
         return False
     
     try:
         os.remove(session_path)
+        index.pop(token, None)
         return True
     except OSError:
         return False
@@ -112,23 +180,11 @@ def list_sessions() -> list[dict]:
     Returns:
         List of session metadata
     """
-    _ensure_storage_dir()
-    
-    sessions = []
-    for session_file in STORAGE_DIR.glob("*.json"):
-        try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                sessions.append({
-                    "token": data.get("token"),
-                    "files_stored": [f["filename"] for f in data.get("files", [])],
-                    "timezone": data.get("timezone"),
-                    "created_at": data.get("created_at")
-                })
-        except (json.JSONDecodeError, IOError):
-            continue
-    
-    return sessions
+    # Served straight from the index: no disk reads, no json parsing
+    return [
+        {k: v for k, v in meta.items() if k != "path"}
+        for meta in _get_session_index().values()
+    ]
 
 
 def cleanup_expired_sessions(max_age_hours: int = 24) -> int:
@@ -141,25 +197,40 @@ def cleanup_expired_sessions(max_age_hours: int = 24) -> int:
     Returns:
         Number of sessions deleted
     """
-    _ensure_storage_dir()
-    
     deleted_count = 0
     now = datetime.utcnow()
-    
-    for session_file in STORAGE_DIR.glob("*.json"):
+    index = _get_session_index()
+
+    # Age check runs on the in-memory index; disk is only touched for the
+    # sessions that actually expired
+    for token, meta in list(index.items()):
+        created_at_str = meta.get("created_at") or ""
+        if not created_at_str:
+            continue
+
         try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                created_at_str = data.get("created_at", "")
-                
-                if created_at_str:
-                    created_at = datetime.fromisoformat(created_at_str.rstrip('Z'))
-                    age_hours = (now - created_at).total_seconds() / 3600
-                    
-                    if age_hours > max_age_hours:
-                        os.remove(session_file)
-                        deleted_count += 1
-        except (json.JSONDecodeError, IOError, ValueError):
+            # removesuffix returns the string itself when there is no Z,
+            # so non-UTC-suffixed stamps cost no copy; parse stays naive to
+            # match utcnow() above
+            created_at = datetime.fromisoformat(created_at_str.removesuffix('Z'))
+        except ValueError:
             continue
-    
+
+        age_hours = (now - created_at).total_seconds() / 3600
+        if age_hours > max_age_hours:
+            # Remove the file the index entry was built from, not a path
+            # reconstructed from the token — preprocessed sessions live in
+            # preprocessed_{token}.json and would otherwise be missed
+            try:
+                os.remove(meta["path"])
+            except FileNotFoundError:
+                # Already gone (stale entry); drop it but don't count it
+                index.pop(token, None)
+                continue
+            except OSError:
+                # Keep the entry so the next cleanup run retries
+                continue
+            index.pop(token, None)
+            deleted_count += 1
+
     return deleted_count
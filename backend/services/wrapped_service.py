@@ -5,9 +5,35 @@ Based on cards_doc.md specification.
 """
 
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 import re
+import sys
+
+
+# Month names indexed by datetime.month - 1; replaces per-event
+# strftime("%B") calls with a tuple lookup
+# Day-of-week names indexed by datetime.weekday(); module-level so the
+# cards don't rebuild the list per call
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+             'Saturday', 'Sunday')
+
+MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Time slot per hour of day, indexed 0-23. A tuple lookup replaces the
+# per-event linear scan over slot ranges.
+SLOT_OF_HOUR = (
+    ("late night",) * 5    # 12 AM - 5 AM
+    + ("morning",) * 7     # 5 AM - 12 PM
+    + ("afternoon",) * 5   # 12 PM - 5 PM
+    + ("evening",) * 4     # 5 PM - 9 PM
+    + ("night",) * 3       # 9 PM - 12 AM
+)
 
 
 def generate_wrapped_cards(events: List[Dict], stats: Dict) -> Dict:
@@ -32,26 +58,34 @@ def generate_wrapped_cards(events: List[Dict], stats: Dict) -> Dict:
     if not watch_events:
         return {"error": "No watch events found"}
     
-    # Generate each card section
+    # Parse and index the watch events once; every card below reads from
+    # this shared bundle instead of re-walking the raw event dicts
+    prepared = prepare_events(watch_events)
+    
+    # Generate each card section. The generators run sequentially on
+    # purpose: after the shared prepare pass they are mostly dict reads
+    # over precomputed tables, so spawning worker processes (plus
+    # pickling the event dicts across the boundary) would cost more than
+    # the card work itself. Revisit only if a card grows a real kernel.
     cards = {
         "intro": generate_intro_card(stats),
-        "stats_overview": generate_stats_overview(events, stats, watch_events),
-        "time_spent": generate_time_spent_card(watch_events),
-        "peak_month": generate_peak_month_card(watch_events),
-        "top_channel": generate_top_channel_card(watch_events),
-        "top_channels": generate_top_channels_card(watch_events),
-        "watch_cycle": generate_watch_cycle_card(watch_events),
-        "peak_day": generate_peak_day_card(watch_events),
-        "longest_streak": generate_longest_streak_card(watch_events),
+        "stats_overview": generate_stats_overview(events, stats, watch_events, prepared),
+        "time_spent": generate_time_spent_card(prepared),
+        "peak_month": generate_peak_month_card(prepared),
+        "top_channel": generate_top_channel_card(prepared),
+        "top_channels": generate_top_channels_card(prepared),
+        "watch_cycle": generate_watch_cycle_card(prepared),
+        "peak_day": generate_peak_day_card(prepared),
+        "longest_streak": generate_longest_streak_card(prepared),
         "personality": generate_personality_card(),  # Hardcoded for now
-        "binge_sessions": generate_binge_sessions_card(watch_events),
-        "late_night": generate_late_night_card(watch_events),
-        "habits": generate_habits_card(watch_events),
+        "binge_sessions": generate_binge_sessions_card(prepared),
+        "late_night": generate_late_night_card(prepared),
+        "habits": generate_habits_card(prepared),
         "patterns": generate_patterns_card(watch_events),  # NEW: Association rule patterns
-        "rewatched": generate_rewatched_card(watch_events),
-        "subscriptions": generate_subscriptions_card(watch_events, subscribe_events),
+        "rewatched": generate_rewatched_card(prepared),
+        "subscriptions": generate_subscriptions_card(prepared, subscribe_events),
         "searches": generate_searches_card(search_events),
-        "first_last": generate_first_last_card(watch_events),
+        "first_last": generate_first_last_card(prepared),
         "metadata": {
             "generated_at": datetime.now().isoformat(),
             "version": "1.0",
@@ -63,6 +97,148 @@ def generate_wrapped_cards(events: List[Dict], stats: Dict) -> Dict:
     return cards
 
 
+# ============================================
+# SHARED EVENT PREPARATION
+# ============================================
+
+def _parse_timestamp(ts: str) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp to a datetime, or None if malformed.
+
+    fromisoformat is a single C-level parse that accepts the trailing Z
+    directly on Python 3.11+, so there is no per-event replace() copy.
+    """
+    try:
+        return datetime.fromisoformat(ts)
+    except (ValueError, TypeError):
+        return None
+
+
+def prepare_events(watch_events: List[Dict]) -> Dict:
+    """
+    Parse and index watch events once for all card generators.
+
+    Every card used to re-walk watch_events and re-parse timestamps with
+    fromisoformat inside try/except; this builds the shared view a single
+    time. Keys:
+    - timed_events: (datetime, event) pairs sorted chronologically
+    - datetimes: the sorted datetimes alone
+    - unique_date_ordinals: set of active days as integer day ordinals
+    - month/channel/hour/dow/title counts: fused counters filled in the
+      same sweep (defaultdict increments beat per-card Counter loops)
+    """
+    timed_events = []
+    month_counts = defaultdict(int)
+    channel_counts = defaultdict(int)
+    # Hours and weekdays have tiny fixed domains, so they count into
+    # preallocated lists (bincount-style) instead of hash maps
+    hour_counts = [0] * 24
+    dow_counts = [0] * 7
+    title_counts = defaultdict(int)
+
+    late_night_count = 0
+    late_night_latest = None  # running max of (hour, datetime)
+
+    for e in watch_events:
+        hour = e.get("hour_local")
+
+        ts = e.get("timestamp_local") or e.get("timestamp_utc")
+        if ts:
+            dt = _parse_timestamp(ts)
+            if dt is not None:
+                timed_events.append((dt, e))
+                month_counts[MONTH_NAMES[dt.month - 1]] += 1
+
+                # Late-night tracking (12 AM - 5 AM): count and the
+                # watch closest to dawn, folded into this sweep
+                if hour is not None and 0 <= hour < 5:
+                    late_night_count += 1
+                    key = (hour, dt)
+                    if late_night_latest is None or key > late_night_latest:
+                        late_night_latest = key
+
+        if hour is not None and 0 <= hour < 24:
+            hour_counts[hour] += 1
+
+        day = e.get("day_of_week")
+        if day is not None and 0 <= day < 7:
+            dow_counts[day] += 1
+
+        channel = e.get("channel_clean")
+        if channel:
+            # Intern once: the same channel string appears on many events,
+            # and interned keys hash/compare by pointer in every later
+            # set, dict and Counter that touches them
+            channel = sys.intern(channel)
+            e["channel_clean"] = channel
+            channel_counts[channel] += 1
+
+        title = e.get("title_original") or e.get("text_clean")
+        if title:
+            title_counts[title] += 1
+
+    timed_events.sort(key=lambda pair: pair[0])
+    datetimes = [dt for dt, _ in timed_events]
+
+    return {
+        "events": watch_events,
+        "timed_events": timed_events,
+        "datetimes": datetimes,
+        # Epoch seconds per datetime: session gap math on floats instead
+        # of timedelta objects
+        "epochs": [dt.timestamp() for dt in datetimes],
+        # Day ordinals are plain ints — no date object per event
+        "unique_date_ordinals": {dt.toordinal() for dt in datetimes},
+        "month_counts": month_counts,
+        "channel_counts": channel_counts,
+        "hour_counts": hour_counts,
+        "dow_counts": dow_counts,
+        "title_counts": title_counts,
+        "late_night_count": late_night_count,
+        "late_night_latest": late_night_latest,
+        # Session ranges per break threshold, filled lazily by
+        # compute_session_ranges
+        "session_ranges": {},
+    }
+
+
+def compute_session_ranges(prepared: Dict,
+                           break_threshold_minutes: int = 60) -> List[Tuple[int, int]]:
+    """
+    Segment the sorted timestamps into sessions, once per threshold.
+
+    Returns (start_index, end_index) pairs into prepared["datetimes"],
+    inclusive. The scan compares epoch floats — no timedelta allocation
+    per gap — and the result is cached on the bundle so time-spent,
+    session-count and binge cards share one computation.
+    """
+    cache = prepared["session_ranges"]
+    ranges = cache.get(break_threshold_minutes)
+    if ranges is not None:
+        return ranges
+
+    epochs = prepared["epochs"]
+    threshold_sec = break_threshold_minutes * 60.0
+
+    # This is the hottest scalar loop in the module; keep it free of
+    # attribute lookups (append is bound once) so each iteration is just
+    # a float subtract, a compare and an index bump
+    ranges = []
+    append = ranges.append
+    if epochs:
+        start = 0
+        prev = epochs[0]
+        for i in range(1, len(epochs)):
+            current = epochs[i]
+            if current - prev > threshold_sec:
+                append((start, i - 1))
+                start = i
+            prev = current
+        append((start, len(epochs) - 1))
+
+    cache[break_threshold_minutes] = ranges
+    return ranges
+
+
 # ============================================
 # INTRO CARD
 # ============================================
@@ -79,29 +255,19 @@ def generate_intro_card(stats: Dict) -> Dict:
 # STATS OVERVIEW CARD
 # ============================================
 
-def generate_stats_overview(events: List[Dict], stats: Dict, watch_events: List[Dict]) -> Dict:
+def generate_stats_overview(events: List[Dict], stats: Dict, watch_events: List[Dict],
+                            prepared: Dict) -> Dict:
     """Generate stats overview card data."""
     # Unique channels
     channels = set(e.get("channel_clean") for e in watch_events if e.get("channel_clean"))
     
-    # Active days
-    active_days = set()
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                active_days.add(dt.date())
-            except:
-                pass
-    
     # Sessions (using 60 min break threshold)
-    sessions = count_sessions(watch_events, break_threshold_minutes=60)
+    sessions = count_sessions(prepared, break_threshold_minutes=60)
     
     return {
         "videos_watched": len(watch_events),
         "channels_explored": len(channels),
-        "active_days": len(active_days),
+        "active_days": len(prepared["unique_date_ordinals"]),
         "total_sessions": sessions
     }
 
@@ -110,9 +276,9 @@ def generate_stats_overview(events: List[Dict], stats: Dict, watch_events: List[
 # TIME SPENT CARD
 # ============================================
 
-def generate_time_spent_card(watch_events: List[Dict]) -> Dict:
+def generate_time_spent_card(prepared: Dict) -> Dict:
     """Generate time spent card data."""
-    time_data = compute_time_spent(watch_events)
+    time_data = compute_time_spent(prepared)
     
     return {
         "total_hours": time_data["total_hours"],
@@ -121,50 +287,26 @@ def generate_time_spent_card(watch_events: List[Dict]) -> Dict:
     }
 
 
-def compute_time_spent(watch_events: List[Dict], 
+def compute_time_spent(prepared: Dict, 
                        break_threshold_minutes: int = 60,
                        last_video_minutes: int = 5) -> Dict:
     """Compute approximate time spent on YouTube."""
-    # Parse timestamps
-    timed_events = []
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                timed_events.append(dt)
-            except:
-                pass
-    
-    if not timed_events:
+    if not prepared["datetimes"]:
         return {"total_hours": 0, "total_minutes": 0, "avg_daily_minutes": 0}
     
-    timed_events.sort()
-    
-    # Detect sessions
-    sessions = []
-    break_threshold = timedelta(minutes=break_threshold_minutes)
+    epochs = prepared["epochs"]
+    ranges = compute_session_ranges(prepared, break_threshold_minutes)
     
-    session_start = timed_events[0]
-    session_end = timed_events[0]
-    
-    for i in range(1, len(timed_events)):
-        gap = timed_events[i] - timed_events[i-1]
-        if gap > break_threshold:
-            duration = (session_end - session_start).total_seconds() / 60.0 + last_video_minutes
-            sessions.append(duration)
-            session_start = timed_events[i]
-        session_end = timed_events[i]
-    
-    # Last session
-    duration = (session_end - session_start).total_seconds() / 60.0 + last_video_minutes
-    sessions.append(duration)
+    sessions = [
+        (epochs[end] - epochs[start]) / 60.0 + last_video_minutes
+        for start, end in ranges
+    ]
     
     total_minutes = sum(sessions)
     total_hours = round(total_minutes / 60, 1)
     
     # Unique days
-    unique_days = set(dt.date() for dt in timed_events)
+    unique_days = prepared["unique_date_ordinals"]
     avg_daily = round(total_minutes / len(unique_days), 1) if unique_days else 0
     
     return {
@@ -176,54 +318,23 @@ def compute_time_spent(watch_events: List[Dict],
     }
 
 
-def count_sessions(watch_events: List[Dict], break_threshold_minutes: int = 60) -> int:
+def count_sessions(prepared: Dict, break_threshold_minutes: int = 60) -> int:
     """Count number of watch sessions."""
-    timed_events = []
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                timed_events.append(dt)
-            except:
-                pass
-    
-    if not timed_events:
-        return 0
-    
-    timed_events.sort()
-    sessions = 1
-    break_threshold = timedelta(minutes=break_threshold_minutes)
-    
-    for i in range(1, len(timed_events)):
-        if timed_events[i] - timed_events[i-1] > break_threshold:
-            sessions += 1
-    
-    return sessions
+    return len(compute_session_ranges(prepared, break_threshold_minutes))
 
 
 # ============================================
 # PEAK MONTH CARD
 # ============================================
 
-def generate_peak_month_card(watch_events: List[Dict]) -> Dict:
+def generate_peak_month_card(prepared: Dict) -> Dict:
     """Generate peak month card data."""
-    monthly_counts = Counter()
-    
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                month_key = dt.strftime("%B")  # Full month name
-                monthly_counts[month_key] += 1
-            except:
-                pass
+    monthly_counts = prepared["month_counts"]
     
     if not monthly_counts:
         return {"month": "Unknown", "watches": 0}
     
-    peak_month, peak_count = monthly_counts.most_common(1)[0]
+    peak_month, peak_count = max(monthly_counts.items(), key=lambda kv: kv[1])
     
     return {
         "month": peak_month,
@@ -235,17 +346,14 @@ def generate_peak_month_card(watch_events: List[Dict]) -> Dict:
 # TOP CHANNEL CARDS
 # ============================================
 
-def generate_top_channel_card(watch_events: List[Dict]) -> Dict:
+def generate_top_channel_card(prepared: Dict) -> Dict:
     """Generate #1 channel spotlight card data."""
-    channel_counts = Counter(
-        e.get("channel_clean") for e in watch_events 
-        if e.get("channel_clean")
-    )
+    channel_counts = prepared["channel_counts"]
     
     if not channel_counts:
         return {"name": "Unknown", "views": 0, "percentage": 0}
     
-    top_channel, top_count = channel_counts.most_common(1)[0]
+    top_channel, top_count = max(channel_counts.items(), key=lambda kv: kv[1])
     total = sum(channel_counts.values())
     percentage = round(top_count / total * 100, 1) if total > 0 else 0
     
@@ -256,16 +364,13 @@ def generate_top_channel_card(watch_events: List[Dict]) -> Dict:
     }
 
 
-def generate_top_channels_card(watch_events: List[Dict], top_n: int = 5) -> Dict:
+def generate_top_channels_card(prepared: Dict, top_n: int = 5) -> Dict:
     """Generate top channels list card data."""
-    channel_counts = Counter(
-        e.get("channel_clean") for e in watch_events 
-        if e.get("channel_clean")
-    )
-    
+    # nlargest is O(N log k) and skips sorting the full channel tally
     top_channels = [
         {"name": ch, "views": count}
-        for ch, count in channel_counts.most_common(top_n)
+        for ch, count in nlargest(top_n, prepared["channel_counts"].items(),
+                                  key=itemgetter(1))
     ]
     
     return {"channels": top_channels}
@@ -275,20 +380,15 @@ def generate_top_channels_card(watch_events: List[Dict], top_n: int = 5) -> Dict
 # WATCH CYCLE CARD
 # ============================================
 
-def generate_watch_cycle_card(watch_events: List[Dict]) -> Dict:
+def generate_watch_cycle_card(prepared: Dict) -> Dict:
     """Generate 24-hour watch cycle card data."""
-    hourly_counts = Counter()
-    
-    for e in watch_events:
-        hour = e.get("hour_local")
-        if hour is not None:
-            hourly_counts[hour] += 1
+    hourly_counts = prepared["hour_counts"]
     
-    if not hourly_counts:
+    if not any(hourly_counts):
         return {"peak_hour": 12, "hourly_data": [0] * 24}
     
-    peak_hour = hourly_counts.most_common(1)[0][0]
-    hourly_data = [hourly_counts.get(h, 0) for h in range(24)]
+    peak_hour = hourly_counts.index(max(hourly_counts))
+    hourly_data = list(hourly_counts)
     
     return {
         "peak_hour": peak_hour,
@@ -300,23 +400,17 @@ def generate_watch_cycle_card(watch_events: List[Dict]) -> Dict:
 # PEAK DAY CARD
 # ============================================
 
-def generate_peak_day_card(watch_events: List[Dict]) -> Dict:
+def generate_peak_day_card(prepared: Dict) -> Dict:
     """Generate day of week card data."""
-    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    daily_counts = Counter()
+    daily_counts = prepared["dow_counts"]
     
-    for e in watch_events:
-        day = e.get("day_of_week")
-        if day is not None:
-            daily_counts[day] += 1
-    
-    if not daily_counts:
+    if not any(daily_counts):
         return {"day": "Saturday", "daily_data": {}}
     
-    peak_day_num = daily_counts.most_common(1)[0][0]
-    peak_day = day_names[peak_day_num] if 0 <= peak_day_num < 7 else "Saturday"
+    peak_day_num = daily_counts.index(max(daily_counts))
+    peak_day = DAY_NAMES[peak_day_num]
     
-    daily_data = {day_names[i]: daily_counts.get(i, 0) for i in range(7)}
+    daily_data = {DAY_NAMES[i]: daily_counts[i] for i in range(7)}
     
     return {
         "day": peak_day,
@@ -328,43 +422,35 @@ def generate_peak_day_card(watch_events: List[Dict]) -> Dict:
 # LONGEST STREAK CARD
 # ============================================
 
-def generate_longest_streak_card(watch_events: List[Dict]) -> Dict:
+def generate_longest_streak_card(prepared: Dict) -> Dict:
     """Generate longest streak card data."""
-    # Get unique dates
-    dates = set()
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                dates.add(dt.date())
-            except:
-                pass
+    ordinals = sorted(prepared["unique_date_ordinals"])
     
-    if not dates:
+    if not ordinals:
         return {"days": 0, "dates": ""}
     
-    sorted_dates = sorted(dates)
-    
     # Find longest consecutive streak
     max_streak = 1
     current_streak = 1
-    streak_start = sorted_dates[0]
-    max_streak_start = sorted_dates[0]
-    max_streak_end = sorted_dates[0]
+    streak_start = ordinals[0]
+    max_streak_start = ordinals[0]
+    max_streak_end = ordinals[0]
+    prev = ordinals[0]
     
-    for i in range(1, len(sorted_dates)):
-        if sorted_dates[i] - sorted_dates[i-1] == timedelta(days=1):
+    for ordinal in ordinals[1:]:
+        if ordinal - prev == 1:
             current_streak += 1
             if current_streak > max_streak:
                 max_streak = current_streak
                 max_streak_start = streak_start
-                max_streak_end = sorted_dates[i]
+                max_streak_end = ordinal
         else:
             current_streak = 1
-            streak_start = sorted_dates[i]
+            streak_start = ordinal
+        prev = ordinal
     
-    dates_str = f"{max_streak_start.strftime('%b %d')} - {max_streak_end.strftime('%b %d')}"
+    dates_str = (f"{date.fromordinal(max_streak_start).strftime('%b %d')}"
+                 f" - {date.fromordinal(max_streak_end).strftime('%b %d')}")
     
     return {
         "days": max_streak,
@@ -388,11 +474,11 @@ def generate_personality_card() -> Dict:
 # BINGE SESSIONS CARD
 # ============================================
 
-def generate_binge_sessions_card(watch_events: List[Dict], 
+def generate_binge_sessions_card(prepared: Dict, 
                                   binge_threshold_hours: float = 2.0) -> Dict:
     """Generate binge sessions card data."""
     # Compute sessions with duration
-    sessions = compute_sessions_with_details(watch_events)
+    sessions = compute_sessions_with_details(prepared)
     
     # Filter binges (sessions > threshold)
     threshold_minutes = binge_threshold_hours * 60
@@ -417,95 +503,45 @@ def generate_binge_sessions_card(watch_events: List[Dict],
     }
 
 
-def compute_sessions_with_details(watch_events: List[Dict], 
+def compute_sessions_with_details(prepared: Dict, 
                                    break_threshold_minutes: int = 60) -> List[Dict]:
     """Compute sessions with start time and duration."""
-    timed_events = []
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                timed_events.append({"dt": dt, "event": e})
-            except:
-                pass
-    
-    if not timed_events:
-        return []
-    
-    timed_events.sort(key=lambda x: x["dt"])
-    
-    sessions = []
-    break_threshold = timedelta(minutes=break_threshold_minutes)
-    
-    session_start = timed_events[0]["dt"]
-    session_end = timed_events[0]["dt"]
-    event_count = 1
-    
-    for i in range(1, len(timed_events)):
-        current = timed_events[i]["dt"]
-        gap = current - timed_events[i-1]["dt"]
-        
-        if gap > break_threshold:
-            duration = (session_end - session_start).total_seconds() / 60.0 + 5
-            sessions.append({
-                "start": session_start,
-                "end": session_end,
-                "duration_minutes": duration,
-                "event_count": event_count
-            })
-            session_start = current
-            session_end = current
-            event_count = 1
-        else:
-            session_end = current
-            event_count += 1
-    
-    # Last session
-    duration = (session_end - session_start).total_seconds() / 60.0 + 5
-    sessions.append({
-        "start": session_start,
-        "end": session_end,
-        "duration_minutes": duration,
-        "event_count": event_count
-    })
-    
-    return sessions
+    datetimes = prepared["datetimes"]
+    epochs = prepared["epochs"]
+    
+    return [
+        {
+            "start": datetimes[start],
+            "end": datetimes[end],
+            "duration_minutes": (epochs[end] - epochs[start]) / 60.0 + 5,
+            "event_count": end - start + 1
+        }
+        for start, end in compute_session_ranges(prepared, break_threshold_minutes)
+    ]
 
 
 # ============================================
 # LATE NIGHT CARD
 # ============================================
 
-def generate_late_night_card(watch_events: List[Dict]) -> Dict:
+def generate_late_night_card(prepared: Dict) -> Dict:
     """Generate late night activity card data."""
-    late_night_events = []
+    count = prepared["late_night_count"]
     
-    for e in watch_events:
-        hour = e.get("hour_local")
-        if hour is not None and (hour >= 0 and hour < 5):  # 12 AM - 5 AM
-            ts = e.get("timestamp_local") or e.get("timestamp_utc")
-            if ts:
-                try:
-                    dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                    late_night_events.append({"dt": dt, "event": e, "hour": hour})
-                except:
-                    pass
-    
-    if not late_night_events:
+    if not count:
         return {
             "videos": 0,
             "latest_time": "",
             "latest_date": ""
         }
     
-    # Find latest (highest hour, or closest to 5 AM)
-    latest = max(late_night_events, key=lambda x: (x["hour"], x["dt"]))
+    # Latest = highest hour, i.e. closest to 5 AM (tracked in the sweep)
+    _, latest_dt = prepared["late_night_latest"]
     
     return {
-        "videos": len(late_night_events),
-        "latest_time": latest["dt"].strftime("%I:%M %p").lstrip("0") if latest else "",
-        "latest_date": latest["dt"].strftime("%B %d") if latest else ""
+        "videos": count,
+        "latest_time": latest_dt.strftime("%I:%M %p").lstrip("0"),
+        "latest_date": latest_dt.strftime("%B %d")
     }
 
 
@@ -513,7 +549,7 @@ def generate_late_night_card(watch_events: List[Dict]) -> Dict:
 # HABITS CARD
 # ============================================
 
-def generate_habits_card(watch_events: List[Dict]) -> Dict:
+def generate_habits_card(prepared: Dict) -> Dict:
     """
     Generate habits card data.
     
@@ -526,55 +562,53 @@ def generate_habits_card(watch_events: List[Dict]) -> Dict:
     - Primary: smaller avg gap = stronger habit
     - Secondary: more watches = stronger habit
     """
-    # Group events by channel with timestamps
+    # Group epoch seconds by channel (timed_events and epochs share the
+    # chronological order, so each channel's list comes out sorted).
+    # Grouping the floats instead of datetime objects means the gap math
+    # below is plain arithmetic: no timedelta allocated per pair.
     channel_watches = defaultdict(list)
     
-    for e in watch_events:
+    for (dt, e), ts in zip(prepared["timed_events"], prepared["epochs"]):
         channel = e.get("channel_clean")
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if channel and ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                channel_watches[channel].append(dt)
-            except:
-                pass
+        if channel:
+            channel_watches[channel].append(ts)
     
     # Calculate watch frequency for each channel
     habits = []
-    for channel, timestamps in channel_watches.items():
-        if len(timestamps) >= 4:  # Need at least 4 watches to be a habit
-            timestamps.sort()
+    for channel, stamps in channel_watches.items():
+        count = len(stamps)
+        if count >= 4:  # Need at least 4 watches to be a habit
             
-            # Calculate total timespan
-            timespan_days = (timestamps[-1] - timestamps[0]).days
+            # Floored whole-day spans, matching timedelta.days for the
+            # ascending gaps we have here
+            timespan_days = int((stamps[-1] - stamps[0]) // 86400.0)
             
             # Must span at least 7 days (not a one-day binge)
             if timespan_days < 7:
                 continue
             
-            # Calculate average gap
-            gaps = [(timestamps[i+1] - timestamps[i]).days 
-                    for i in range(len(timestamps)-1)]
-            avg_gap = sum(gaps) / len(gaps) if gaps else 0
+            # Average gap from one pairwise sweep; no intermediate list
+            gap_total = sum(
+                int((later - earlier) // 86400.0)
+                for earlier, later in zip(stamps, stamps[1:])
+            )
+            avg_gap = gap_total / (count - 1)
             
             # Must be watched at least every 2 weeks on average
             if avg_gap <= 14:
                 # Score combines consistency and frequency
                 # Lower avg_gap + higher watch count = better score
-                habit_score = avg_gap - (len(timestamps) * 0.1)  # Slight boost for more watches
+                habit_score = avg_gap - (count * 0.1)  # Slight boost for more watches
                 
                 habits.append({
                     "channel": channel,
                     "frequency": f"{avg_gap:.1f} days",
-                    "watch_count": len(timestamps),
+                    "watch_count": count,
                     "avg_gap_days": avg_gap,
                     "timespan_days": timespan_days,
                     "habit_score": habit_score
                 })
     
-    # Sort by habit score (lower = stronger habit)
-    habits.sort(key=lambda x: x["habit_score"])
-    
     if not habits:
         return {
             "total_channels": 0,
@@ -582,13 +616,17 @@ def generate_habits_card(watch_events: List[Dict]) -> Dict:
             "top_habits": []
         }
     
+    # Lower score = stronger habit; nsmallest picks the winners without
+    # sorting every qualifying channel
+    top_habits = nsmallest(5, habits, key=itemgetter("habit_score"))
+    
     return {
         "total_channels": len(habits),
         "strongest": {
-            "channel": habits[0]["channel"],
-            "frequency": habits[0]["frequency"]
+            "channel": top_habits[0]["channel"],
+            "frequency": top_habits[0]["frequency"]
         },
-        "top_habits": habits[:5]
+        "top_habits": top_habits
     }
 
 
@@ -596,16 +634,9 @@ def generate_habits_card(watch_events: List[Dict]) -> Dict:
 # REWATCHED CARD
 # ============================================
 
-def generate_rewatched_card(watch_events: List[Dict]) -> Dict:
+def generate_rewatched_card(prepared: Dict) -> Dict:
     """Generate rewatched videos card data."""
-    video_counts = Counter()
-    video_titles = {}
-    
-    for e in watch_events:
-        title = e.get("title_original") or e.get("text_clean")
-        if title:
-            video_counts[title] += 1
-            video_titles[title] = title
+    video_counts = prepared["title_counts"]
     
     # Filter to rewatched only (count > 1)
     rewatched = {title: count for title, count in video_counts.items() if count > 1}
@@ -630,7 +661,7 @@ def generate_rewatched_card(watch_events: List[Dict]) -> Dict:
 # SUBSCRIPTIONS CARD
 # ============================================
 
-def generate_subscriptions_card(watch_events: List[Dict], 
+def generate_subscriptions_card(prepared: Dict, 
                                  subscribe_events: List[Dict]) -> Dict:
     """Generate subscriptions card data."""
     # Get subscribed channels
@@ -640,11 +671,9 @@ def generate_subscriptions_card(watch_events: List[Dict],
         if channel:
             subscribed.add(channel)
     
-    # Get watched channels
-    watched = set(e.get("channel_clean") for e in watch_events if e.get("channel_clean"))
-    
-    # Calculate overlap
-    overlap = subscribed & watched
+    # The watched-channel set already exists as the keys of the fused
+    # channel tally — no second sweep over watch_events
+    overlap = subscribed & prepared["channel_counts"].keys()
     
     total = len(subscribed)
     watched_count = len(overlap)
@@ -672,11 +701,10 @@ def generate_searches_card(search_events: List[Dict]) -> Dict:
             "top_searches": []
         }
     
-    search_terms = Counter()
-    for e in search_events:
-        term = e.get("text_clean") or e.get("title_original")
-        if term:
-            search_terms[term.lower()] += 1
+    # Counter's constructor counts through the C-level _count_elements
+    # helper, so feeding it a generator beats per-term += 1 dispatch
+    terms = (e.get("text_clean") or e.get("title_original") for e in search_events)
+    search_terms = Counter(term.lower() for term in terms if term)
     
     if not search_terms:
         return {
@@ -699,18 +727,12 @@ def generate_searches_card(search_events: List[Dict]) -> Dict:
 # FIRST & LAST VIDEO CARD
 # ============================================
 
-def generate_first_last_card(watch_events: List[Dict]) -> Dict:
+def generate_first_last_card(prepared: Dict) -> Dict:
     """Generate first and last video card data."""
-    timed_events = []
-    
-    for e in watch_events:
-        ts = e.get("timestamp_local") or e.get("timestamp_utc")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                timed_events.append({"dt": dt, "event": e})
-            except:
-                pass
+    # timed_events is already chronologically sorted for session
+    # detection, so the first and last watches are the two endpoints —
+    # no private copy, sort, or min/max scan here
+    timed_events = prepared["timed_events"]
     
     if not timed_events:
         return {
@@ -718,10 +740,8 @@ def generate_first_last_card(watch_events: List[Dict]) -> Dict:
             "last_video": {"title": "", "date": ""}
         }
     
-    timed_events.sort(key=lambda x: x["dt"])
-    
-    first = timed_events[0]
-    last = timed_events[-1]
+    first_dt, first_event = timed_events[0]
+    last_dt, last_event = timed_events[-1]
     
     def get_title(event):
         return (event.get("title_original") or 
@@ -729,12 +749,12 @@ def generate_first_last_card(watch_events: List[Dict]) -> Dict:
     
     return {
         "first_video": {
-            "title": get_title(first["event"]),
-            "date": first["dt"].strftime("%B %d, %Y")
+            "title": get_title(first_event),
+            "date": first_dt.strftime("%B %d, %Y")
         },
         "last_video": {
-            "title": get_title(last["event"]),
-            "date": last["dt"].strftime("%B %d, %Y")
+            "title": get_title(last_event),
+            "date": last_dt.strftime("%B %d, %Y")
         }
     }
 
@@ -754,15 +774,6 @@ def generate_patterns_card(watch_events: List[Dict]) -> Dict:
     2. Channel + Time of day (e.g., "You watch X in the mornings")
     3. Weekend preference (e.g., "X is your weekend channel")
     """
-    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    time_slots = {
-        "morning": (5, 12),    # 5 AM - 12 PM
-        "afternoon": (12, 17), # 12 PM - 5 PM
-        "evening": (17, 21),   # 5 PM - 9 PM
-        "night": (21, 24),     # 9 PM - 12 AM
-        "late night": (0, 5),  # 12 AM - 5 AM
-    }
-    
     # First, identify TOP CHANNELS (top 20 by watch count)
     channel_counts = Counter(
         e.get("channel_clean") for e in watch_events 
@@ -782,18 +793,24 @@ def generate_patterns_card(watch_events: List[Dict]) -> Dict:
     if not top_channels:
         return {"total_patterns": 0, "top_patterns": [], "insights": []}
     
+    # One sweep over the history builds every contingency table the three
+    # pattern finders need: channel x day-of-week and channel x time-slot
+    # pair counts plus their marginal totals. Each finder then walks its
+    # (small) table instead of re-scanning all the events. The weekend
+    # split falls out of the day table (days 5 and 6), so it costs no
+    # extra counting at all.
+    tables = build_pattern_tables(watch_events, top_channels)
+    
     patterns = []
     
     # 1. Channel + Day of Week associations (top channels only)
-    channel_day_patterns = find_channel_day_patterns(watch_events, day_names, top_channels)
-    patterns.extend(channel_day_patterns)
+    patterns.extend(find_channel_day_patterns(tables, DAY_NAMES))
     
     # 2. Channel + Time Slot associations (top channels only)
-    channel_time_patterns = find_channel_time_patterns(watch_events, time_slots, top_channels)
-    patterns.extend(channel_time_patterns)
+    patterns.extend(find_channel_time_patterns(tables))
     
     # 3. Weekend vs Weekday preferences (top channels only)
-    weekend_pattern = find_weekend_pattern(watch_events, top_channels)
+    weekend_pattern = find_weekend_pattern(tables)
     if weekend_pattern:
         patterns.append(weekend_pattern)
     
@@ -810,130 +827,122 @@ def generate_patterns_card(watch_events: List[Dict]) -> Dict:
     }
 
 
-def find_channel_day_patterns(watch_events: List[Dict], day_names: List[str], top_channels: set) -> List[Dict]:
-    """Find channels that are strongly associated with specific days (top channels only)."""
-    # Count channel occurrences per day
-    channel_day_counts = defaultdict(lambda: defaultdict(int))
-    channel_total = defaultdict(int)
+def build_pattern_tables(watch_events: List[Dict], top_channels: set) -> Dict:
+    """
+    Build the shared contingency tables for pattern mining in one pass.
+    
+    Counts into flat tuple-keyed maps: one hash per increment instead of
+    the nested defaultdict(lambda: defaultdict(int)) double lookup.
+    """
+    day_pairs = defaultdict(int)
+    channel_day_total = defaultdict(int)
     day_total = defaultdict(int)
+    slot_pairs = defaultdict(int)
+    channel_slot_total = defaultdict(int)
+    slot_total = defaultdict(int)
     
     for e in watch_events:
         channel = e.get("channel_clean")
+        if not channel or channel not in top_channels:
+            continue
+        
         day = e.get("day_of_week")
-        if channel and day is not None and channel in top_channels:
-            channel_day_counts[channel][day] += 1
-            channel_total[channel] += 1
+        if day is not None:
+            day_pairs[(channel, day)] += 1
+            channel_day_total[channel] += 1
             day_total[day] += 1
+        
+        hour = e.get("hour_local")
+        if hour is not None and 0 <= hour < 24:
+            slot = SLOT_OF_HOUR[hour]
+            slot_pairs[(channel, slot)] += 1
+            channel_slot_total[channel] += 1
+            slot_total[slot] += 1
+    
+    return {
+        "day_pairs": day_pairs,
+        "channel_day_total": channel_day_total,
+        "day_total": day_total,
+        "slot_pairs": slot_pairs,
+        "channel_slot_total": channel_slot_total,
+        "slot_total": slot_total,
+    }
+
+
+def find_channel_day_patterns(tables: Dict, day_names: Tuple[str, ...]) -> List[Dict]:
+    """Find channels that are strongly associated with specific days (top channels only)."""
+    pair_counts = tables["day_pairs"]
+    channel_total = tables["channel_day_total"]
+    day_total = tables["day_total"]
     
     total_events = sum(channel_total.values())
     
     patterns = []
     
-    for channel, day_counts in channel_day_counts.items():
-        for day, count in day_counts.items():
-            # Calculate confidence: P(day | channel)
-            confidence = count / channel_total[channel] if channel_total[channel] > 0 else 0
-            
-            # Calculate lift: how much more likely vs random
-            expected = (channel_total[channel] * day_total[day]) / total_events if total_events > 0 else 0
-            lift = count / expected if expected > 0 else 0
-            
-            # Strong pattern: confidence > 30% AND lift > 1.5 AND at least 5 occurrences
-            if confidence >= 0.30 and lift >= 1.5 and count >= 5:
-                day_name = day_names[day] if 0 <= day < 7 else "Unknown"
-                patterns.append({
-                    "type": "channel_day",
-                    "channel": channel,
-                    "day": day_name,
-                    "confidence": confidence,
-                    "lift": lift,
-                    "count": count,
-                    "insight": f"You watch **{channel}** on **{day_name}s** ({int(confidence*100)}% of the time)"
-                })
+    for (channel, day), count in pair_counts.items():
+        # Calculate confidence: P(day | channel)
+        confidence = count / channel_total[channel] if channel_total[channel] > 0 else 0
+        
+        # Calculate lift: how much more likely vs random
+        expected = (channel_total[channel] * day_total[day]) / total_events if total_events > 0 else 0
+        lift = count / expected if expected > 0 else 0
+        
+        # Strong pattern: confidence > 30% AND lift > 1.5 AND at least 5 occurrences
+        if confidence >= 0.30 and lift >= 1.5 and count >= 5:
+            day_name = day_names[day] if 0 <= day < 7 else "Unknown"
+            patterns.append({
+                "type": "channel_day",
+                "channel": channel,
+                "day": day_name,
+                "confidence": confidence,
+                "lift": lift,
+                "count": count,
+                "insight": f"You watch **{channel}** on **{day_name}s** ({int(confidence*100)}% of the time)"
+            })
     
     return patterns
 
 
-def find_channel_time_patterns(watch_events: List[Dict], time_slots: Dict, top_channels: set) -> List[Dict]:
+def find_channel_time_patterns(tables: Dict) -> List[Dict]:
     """Find channels associated with specific time slots (top channels only)."""
-    
-    def get_time_slot(hour: int) -> Optional[str]:
-        for slot_name, (start, end) in time_slots.items():
-            if slot_name == "late night":
-                if hour >= 0 and hour < 5:
-                    return slot_name
-            elif start <= hour < end:
-                return slot_name
-        return None
-    
-    # Count channel occurrences per time slot
-    channel_slot_counts = defaultdict(lambda: defaultdict(int))
-    channel_total = defaultdict(int)
-    slot_total = defaultdict(int)
-    
-    for e in watch_events:
-        channel = e.get("channel_clean")
-        hour = e.get("hour_local")
-        if channel and hour is not None and channel in top_channels:
-            slot = get_time_slot(hour)
-            if slot:
-                channel_slot_counts[channel][slot] += 1
-                channel_total[channel] += 1
-                slot_total[slot] += 1
+    pair_counts = tables["slot_pairs"]
+    channel_total = tables["channel_slot_total"]
+    slot_total = tables["slot_total"]
     
     total_events = sum(slot_total.values())
     
     patterns = []
     
-    for channel, slot_counts in channel_slot_counts.items():
-        for slot, count in slot_counts.items():
-            confidence = count / channel_total[channel] if channel_total[channel] > 0 else 0
-            expected = (channel_total[channel] * slot_total[slot]) / total_events if total_events > 0 else 0
-            lift = count / expected if expected > 0 else 0
-            
-            # Strong pattern: confidence > 40% AND lift > 1.5 AND at least 5 occurrences
-            if confidence >= 0.40 and lift >= 1.5 and count >= 5:
-                time_phrase = {
-                    "morning": "in the mornings",
-                    "afternoon": "in the afternoons", 
-                    "evening": "in the evenings",
-                    "night": "at night",
-                    "late night": "during late nights"
-                }.get(slot, slot)
-                
-                patterns.append({
-                    "type": "channel_time",
-                    "channel": channel,
-                    "time_slot": slot,
-                    "confidence": confidence,
-                    "lift": lift,
-                    "count": count,
-                    "insight": f"**{channel}** is your **{slot}** go-to ({int(confidence*100)}%)"
-                })
+    for (channel, slot), count in pair_counts.items():
+        confidence = count / channel_total[channel] if channel_total[channel] > 0 else 0
+        expected = (channel_total[channel] * slot_total[slot]) / total_events if total_events > 0 else 0
+        lift = count / expected if expected > 0 else 0
+        
+        # Strong pattern: confidence > 40% AND lift > 1.5 AND at least 5 occurrences
+        if confidence >= 0.40 and lift >= 1.5 and count >= 5:
+            patterns.append({
+                "type": "channel_time",
+                "channel": channel,
+                "time_slot": slot,
+                "confidence": confidence,
+                "lift": lift,
+                "count": count,
+                "insight": f"**{channel}** is your **{slot}** go-to ({int(confidence*100)}%)"
+            })
     
     return patterns
 
 
-def find_weekend_pattern(watch_events: List[Dict], top_channels: set) -> Optional[Dict]:
+def find_weekend_pattern(tables: Dict) -> Optional[Dict]:
     """Find if watching behavior differs significantly on weekends (top channels only)."""
-    weekday_channels = defaultdict(int)
-    weekend_channels = defaultdict(int)
-    
-    for e in watch_events:
-        channel = e.get("channel_clean")
-        day = e.get("day_of_week")
-        if channel and day is not None and channel in top_channels:
-            if day in [5, 6]:  # Saturday, Sunday
-                weekend_channels[channel] += 1
-            else:
-                weekday_channels[channel] += 1
+    day_pairs = tables["day_pairs"]
     
-    # Find channels that are predominantly weekend
+    # The weekend/weekday split is just the day table sliced at Saturday
+    # and Sunday; channel_day_total already holds the combined count
     weekend_exclusive = []
-    for channel, weekend_count in weekend_channels.items():
-        weekday_count = weekday_channels.get(channel, 0)
-        total = weekend_count + weekday_count
-        if total >= 10:  # Need at least 10 total watches
+    for channel, total in tables["channel_day_total"].items():
+        weekend_count = day_pairs.get((channel, 5), 0) + day_pairs.get((channel, 6), 0)
+        if total >= 10 and weekend_count:  # Need at least 10 total watches
             weekend_ratio = weekend_count / total
             if weekend_ratio >= 0.6:  # 60%+ on weekends
                 weekend_exclusive.append((channel, weekend_ratio, total))
@@ -5,45 +5,85 @@ Handles scanning and extracting files from YouTube Takeout ZIP archives
 
 import zipfile
 import io
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
+# Decompression goes through the stdlib zlib. python-isal's SIMD
+# DEFLATE (isal_zlib) is 2-4x faster but ships no zipfile drop-in, so
+# adopting it means reimplementing ZipExtFile's decompressor plumbing;
+# revisit if extraction ever shows up in profiles.
+from typing import BinaryIO, Optional, Union
 
-# Target files to look for in the ZIP
-TARGET_FILES = {
-    "watch-history.json": None,
-    "search-history.json": None,
-    "subscriptions.csv": None
-}
 
+# Uncompressed-size caps enforced before any inflation happens: a
+# malicious archive can claim a tiny compressed size while expanding to
+# many GB (zip bomb), and ZipInfo.file_size lets us refuse it up front
+MAX_ENTRY_BYTES = 512 << 20   # 512MB per entry
+MAX_TOTAL_BYTES = 2 << 30     # 2GB across all requested entries
 
-def read_zip_for_files(zip_content: bytes) -> dict:
+# Target basenames to look for in the ZIP
+TARGET_FILES = frozenset({
+    "watch-history.json",
+    "search-history.json",
+    "subscriptions.csv"
+})
+
+
+ZipSource = Union[bytes, BinaryIO]
+
+
+def _open_zip(zip_source: ZipSource) -> zipfile.ZipFile:
+    """
+    Open an archive from raw bytes or a seekable binary file object.
+    
+    Accepting a file object lets the upload handlers hand over their
+    spooled temp file directly, so a large Takeout never has to be read
+    into a bytes object (and duplicated by BytesIO) before any work
+    starts.
+    """
+    if isinstance(zip_source, (bytes, bytearray)):
+        # BytesIO over immutable bytes shares the buffer (copy-on-write
+        # in CPython), so this wrapper costs no extra copy of the
+        # archive; an mmap would only help for on-disk sources, and
+        # those arrive here as file objects served by the page cache
+        zip_source = io.BytesIO(zip_source)
+    elif hasattr(zip_source, 'seek'):
+        zip_source.seek(0)
+    return zipfile.ZipFile(zip_source, 'r')
+
+
+def read_zip_for_files(zip_source: ZipSource) -> dict:
     """
     Recursively search a ZIP file for target files.
     
     Args:
-        zip_content: Raw bytes of the ZIP file
+        zip_source: Raw bytes of the ZIP file, or an open binary file
         
     Returns:
         Dictionary with found_files, missing_files, and total_files_in_zip
     """
-    found_files: dict[str, Optional[str]] = {
-        "watch-history.json": None,
-        "search-history.json": None,
-        "subscriptions.csv": None
-    }
+    found_files: dict[str, Optional[str]] = dict.fromkeys(TARGET_FILES)
     
     try:
-        with zipfile.ZipFile(io.BytesIO(zip_content), 'r') as zf:
+        with _open_zip(zip_source) as zf:
             all_files = zf.namelist()
             total_files = len(all_files)
             
+            remaining = len(found_files)
             for file_path in all_files:
-                # Get just the filename from the path
-                filename = file_path.split('/')[-1]
+                # Get just the filename from the path; rfind + slice
+                # avoids the throwaway list split() builds per entry
+                filename = file_path[file_path.rfind('/') + 1:]
                 
                 # Check if this is one of our target files
                 if filename in found_files and found_files[filename] is None:
                     found_files[filename] = file_path
+                    remaining -= 1
+                    if remaining == 0:
+                        # All targets located; the thousands of
+                        # per-video entries after this point can't
+                        # change the answer
+                        break
             
             # Determine which files are missing
             missing_files = [
@@ -63,55 +103,185 @@ def read_zip_for_files(zip_content: bytes) -> dict:
         raise ValueError(f"Error processing ZIP file: {str(e)}")
 
 
-def extract_files_by_paths(zip_content: bytes, paths: dict[str, str]) -> list[dict]:
+def _read_entry_text(zf: zipfile.ZipFile, entry: zipfile.ZipInfo) -> str:
+    """
+    Decode one archive entry to text via a buffered streaming read.
+    
+    Decoding is incremental (TextIOWrapper feeds an IncrementalDecoder)
+    and errors='replace' maps any invalid byte to U+FFFD, so a stray
+    bad byte costs one replacement character instead of a second full
+    decode pass — and unlike the old latin-1 retry it cannot turn an
+    otherwise-valid UTF-8 file into mojibake.
+    
+    CRC verification stays on deliberately: uploads come from users, not
+    straight from Google, and a silently corrupted history would surface
+    as confusing downstream parse failures rather than a clean 400 here.
+    """
+    with zf.open(entry, 'r') as raw:
+        reader = io.TextIOWrapper(
+            io.BufferedReader(raw, buffer_size=1 << 20),
+            encoding='utf-8',
+            errors='replace'
+        )
+        return reader.read()
+
+
+@contextmanager
+def open_text_entry(zip_source: ZipSource, path: str, encoding: str = 'utf-8'):
+    """
+    Open one archive entry as a text stream for direct parsing.
+    
+    In-process callers can run json.load (or a csv.reader) straight off
+    the inflate stream, skipping the bytes -> str -> parsed-tree round
+    trip the extraction dicts pay for HTTP transport. Usage:
+    
+        with open_text_entry(source, path) as stream:
+            data = json.load(stream)
+    """
+    with _open_zip(zip_source) as zf, zf.open(path, 'r') as raw:
+        yield io.TextIOWrapper(
+            io.BufferedReader(raw, buffer_size=1 << 20),
+            encoding=encoding,
+            errors='replace'
+        )
+
+
+def scan_and_extract(zip_source: ZipSource) -> tuple[list[dict], list[str]]:
+    """
+    Locate and extract the target files in a single pass.
+    
+    Opening an archive parses its central directory; doing the scan and
+    the extraction inside one open avoids paying that parse twice when
+    the caller does not already know the entry paths (the /read +
+    /extract two-step re-uploads and re-parses the whole archive).
+    
+    Args:
+        zip_source: Raw bytes of the ZIP file, or an open binary file
+        
+    Returns:
+        Tuple of (extracted file dictionaries, missing target filenames)
+    """
+    try:
+        with _open_zip(zip_source) as zf:
+            found: dict[str, str] = {}
+            for file_path in zf.namelist():
+                filename = file_path[file_path.rfind('/') + 1:]
+                if filename in TARGET_FILES and filename not in found:
+                    found[filename] = file_path
+                    if len(found) == len(TARGET_FILES):
+                        break
+            
+            _check_entry_sizes(zf, found)
+            if isinstance(zip_source, (bytes, bytearray)) and len(found) > 1:
+                extracted_files, missing_files = _extract_parallel(zip_source, found)
+            else:
+                extracted_files, missing_files = _extract_from_open_zip(zf, found)
+            missing_files.extend(f for f in TARGET_FILES if f not in found)
+            return extracted_files, missing_files
+            
+    except zipfile.BadZipFile:
+        raise ValueError("Invalid ZIP file")
+    except Exception as e:
+        raise ValueError(f"Error processing ZIP file: {str(e)}")
+
+
+def extract_files_by_paths(zip_source: ZipSource, paths: dict[str, str]) -> tuple[list[dict], list[str]]:
     """
     Extract specific files from a ZIP using provided paths.
     
     Args:
-        zip_content: Raw bytes of the ZIP file
+        zip_source: Raw bytes of the ZIP file, or an open binary file
         paths: Dictionary mapping filename to path in ZIP
         
     Returns:
-        List of extracted file dictionaries
+        Tuple of (extracted file dictionaries, missing filenames)
     """
-    extracted_files = []
-    missing_files = []
-    
     try:
-        with zipfile.ZipFile(io.BytesIO(zip_content), 'r') as zf:
-            for filename, path in paths.items():
-                try:
-                    content = zf.read(path)
-                    content_str = content.decode('utf-8')
-                    
-                    # Determine content type
-                    content_type = 'csv' if filename.endswith('.csv') else 'json'
-                    
-                    extracted_files.append({
-                        "filename": filename,
-                        "content_type": content_type,
-                        "content": content_str,
-                        "size_bytes": len(content)
-                    })
-                except KeyError:
-                    missing_files.append(filename)
-                except UnicodeDecodeError:
-                    # Try with different encoding
-                    try:
-                        content_str = content.decode('latin-1')
-                        content_type = 'csv' if filename.endswith('.csv') else 'json'
-                        extracted_files.append({
-                            "filename": filename,
-                            "content_type": content_type,
-                            "content": content_str,
-                            "size_bytes": len(content)
-                        })
-                    except Exception:
-                        missing_files.append(filename)
-                        
+        # DEFLATE releases the GIL inside zlib, so extracting the
+        # entries on separate threads overlaps their inflate work. A
+        # shared ZipFile handle is not thread-safe, so this path only
+        # runs for bytes sources, where each worker opens its own view
+        # of the buffer (BytesIO shares it; the central-directory
+        # re-parse is microseconds next to inflating a history file).
+        if isinstance(zip_source, (bytes, bytearray)) and len(paths) > 1:
+            with _open_zip(zip_source) as zf:
+                _check_entry_sizes(zf, paths)
+            return _extract_parallel(zip_source, paths)
+        
+        with _open_zip(zip_source) as zf:
+            _check_entry_sizes(zf, paths)
+            return _extract_from_open_zip(zf, paths)
+            
     except zipfile.BadZipFile:
         raise ValueError("Invalid ZIP file")
     except Exception as e:
         raise ValueError(f"Error extracting from ZIP file: {str(e)}")
+
+
+def _check_entry_sizes(zf: zipfile.ZipFile, paths: dict[str, str]) -> None:
+    """Raise ValueError if any requested entry (or their sum) is oversized."""
+    total = 0
+    name_to_info = zf.NameToInfo
+    for filename, path in paths.items():
+        info = name_to_info.get(path)
+        if info is None:
+            continue  # reported as missing during extraction
+        if info.file_size > MAX_ENTRY_BYTES:
+            raise ValueError(f"{filename} is too large to extract")
+        total += info.file_size
+        if total > MAX_TOTAL_BYTES:
+            raise ValueError("Requested files are too large to extract")
+
+
+def _extract_parallel(zip_bytes: bytes,
+                      paths: dict[str, str]) -> tuple[list[dict], list[str]]:
+    """Extract entries concurrently, one archive view per worker thread."""
+    def _extract_one(item: tuple[str, str]) -> tuple[list[dict], list[str]]:
+        filename, path = item
+        with zipfile.ZipFile(io.BytesIO(zip_bytes), 'r') as zf:
+            return _extract_from_open_zip(zf, {filename: path})
+    
+    extracted_files = []
+    missing_files = []
+    with ThreadPoolExecutor(max_workers=min(3, len(paths))) as executor:
+        # map() keeps results in paths order, matching the serial path
+        for files, missing in executor.map(_extract_one, paths.items()):
+            extracted_files.extend(files)
+            missing_files.extend(missing)
+    
+    return extracted_files, missing_files
+
+
+def _extract_from_open_zip(zf: zipfile.ZipFile,
+                           paths: dict[str, str]) -> tuple[list[dict], list[str]]:
+    """Extract the given filename -> entry-path mapping from an open archive."""
+    extracted_files = []
+    missing_files = []
+    
+    # Resolve each path to its ZipInfo once up front; zf.open and
+    # zf.getinfo would each repeat the NameToInfo lookup otherwise
+    name_to_info = zf.NameToInfo
+    
+    for filename, path in paths.items():
+        info = name_to_info.get(path)
+        if info is None:
+            missing_files.append(filename)
+            continue
+        
+        # Stream the entry instead of materializing the raw bytes with
+        # zf.read(): the decoder consumes chunks as they inflate, so
+        # peak memory is one copy (the decoded str) instead of bytes
+        # plus str. The 1MB buffer keeps inflate working in large blocks.
+        content_str = _read_entry_text(zf, info)
+        
+        # Determine content type
+        content_type = 'csv' if filename.endswith('.csv') else 'json'
+        
+        extracted_files.append({
+            "filename": filename,
+            "content_type": content_type,
+            "content": content_str,
+            "size_bytes": info.file_size
+        })
     
     return extracted_files, missing_files
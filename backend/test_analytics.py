@@ -1,24 +1,74 @@
-"""Test analytics API"""
-import sys
-sys.path.insert(0, '.')
+"""Tests for channel analytics over a synthetic preprocessed session."""
+
+import uuid
+from pathlib import Path
+
+import pytest
 
 from services.analytics_service import get_channel_analytics
-import json
+from services.json_io import json_dump_bytes
+
+STORAGE_DIR = Path(__file__).parent / "storage"
+
+
+def _watch_event(channel: str, engagement: str) -> dict:
+    return {
+        "type": "watch",
+        "engagement": engagement,
+        "channel": channel.title(),
+        "channel_clean": channel,
+        "timestamp_local": "2025-01-01T12:00:00+05:30",
+        "hour_local": 12,
+        "day_of_week": 2,
+    }
+
+
+@pytest.fixture()
+def session_token():
+    """Write a small preprocessed session to storage, remove it after."""
+    STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+    token = f"test-{uuid.uuid4()}"
+
+    events = (
+        [_watch_event("alpha channel", "active")] * 6
+        + [_watch_event("beta channel", "passive")] * 3
+        + [_watch_event("gamma channel", "active")] * 1
+    )
+    session_path = STORAGE_DIR / f"preprocessed_{token}.json"
+    session_path.write_bytes(json_dump_bytes({"events": events, "stats": {}}))
+
+    yield token
+
+    session_path.unlink(missing_ok=True)
+
+
+def test_all_filter(session_token):
+    result = get_channel_analytics(session_token, 5, "all")
+
+    assert result["total_count"] == 10
+    assert result["total_unique_channels"] == 3
+    top = result["top_channels"][0]
+    assert top["channel_clean"] == "alpha channel"
+    assert top["channel"] == "Alpha Channel"
+    assert top["count"] == 6
+
+
+def test_watch_filter_counts_active_only(session_token):
+    result = get_channel_analytics(session_token, 5, "watch")
+
+    assert result["total_count"] == 7
+    assert {c["channel_clean"] for c in result["top_channels"]} == {
+        "alpha channel", "gamma channel"
+    }
+
 
-token = "692d50d2-16a3-4e33-9e67-01a4d2124d4b"
+def test_view_filter_counts_passive_only(session_token):
+    result = get_channel_analytics(session_token, 5, "view")
 
-print("=== Testing 'all' filter ===")
-result_all = get_channel_analytics(token, 5, "all")
-print(f"Total count: {result_all.get('total_count')}")
-print(f"View distribution: {result_all.get('view_distribution')}")
-print(f"Engagement summary: {result_all.get('engagement_summary')}")
+    assert result["total_count"] == 3
+    assert result["top_channels"][0]["channel_clean"] == "beta channel"
 
-print("\n=== Testing 'watch' filter ===")
-result_watch = get_channel_analytics(token, 5, "watch")
-print(f"Total count: {result_watch.get('total_count')}")
-print(f"View distribution: {result_watch.get('view_distribution')}")
 
-print("\n=== Testing 'view' filter ===")
-result_view = get_channel_analytics(token, 5, "view")
-print(f"Total count: {result_view.get('total_count')}")
-print(f"View distribution: {result_view.get('view_distribution')}")
+def test_missing_session_returns_error():
+    result = get_channel_analytics("no-such-token", 5, "all")
+    assert "error" in result
@@ -1,11 +1,21 @@
-"""Test script for channel metadata extraction"""
-import sys
-sys.path.insert(0, '.')
+"""Tests for channel metadata extraction's offline helpers."""
 
-from services.channel_service import get_channel_metadata
-import json
+import pytest
 
-test_url = "https://www.youtube.com/channel/UCXuqSBlHAE6Xw-yeJA0Tunw"
-print(f"Testing with: {test_url}")
-result = get_channel_metadata(test_url)
-print(json.dumps(result, indent=2, default=str))
+# channel_service imports yt_dlp at module scope; skip when it is not
+# installed (it is commented out of the slim deployment requirements)
+pytest.importorskip("yt_dlp")
+
+from services.channel_service import extract_channel_id
+
+
+@pytest.mark.parametrize("url,channel_id", [
+    ("https://www.youtube.com/channel/UCXuqSBlHAE6Xw-yeJA0Tunw",
+     "UCXuqSBlHAE6Xw-yeJA0Tunw"),
+    ("https://www.youtube.com/@LinusTechTips", "@LinusTechTips"),
+    ("https://www.youtube.com/@handle/videos", "@handle"),
+    ("https://example.com/", None),
+    ("", None),
+])
+def test_extract_channel_id(url, channel_id):
+    assert extract_channel_id(url) == channel_id
@@ -0,0 +1,83 @@
+"""Tests for session storage and the in-memory session index."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import services.session_service as session_service
+from services.json_io import json_dump_bytes
+
+
+@pytest.fixture()
+def storage(tmp_path, monkeypatch):
+    """Point the service at an empty storage dir with a fresh index."""
+    monkeypatch.setattr(session_service, "STORAGE_DIR", tmp_path)
+    monkeypatch.setattr(session_service, "_session_index", None)
+    return tmp_path
+
+
+def _write_session(storage, filename: str, token: str, age_hours: float):
+    created_at = (datetime.utcnow() - timedelta(hours=age_hours)).isoformat() + "Z"
+    (storage / filename).write_bytes(json_dump_bytes({
+        "token": token,
+        "files": [],
+        "timezone": "UTC",
+        "created_at": created_at,
+    }, indent=True))
+
+
+def test_create_get_delete_roundtrip(storage):
+    metadata = session_service.create_session(
+        [{"filename": "watch-history.json", "content": "[]"}], "Asia/Kolkata")
+    token = metadata["token"]
+
+    assert metadata["files_stored"] == ["watch-history.json"]
+    assert session_service.get_session(token)["timezone"] == "Asia/Kolkata"
+    assert session_service.delete_session(token) is True
+    assert session_service.get_session(token) is None
+    assert session_service.delete_session(token) is False
+
+
+def test_list_sessions_hides_paths(storage):
+    created = session_service.create_session([], "UTC")
+    _write_session(storage, "preprocessed_abc.json", "abc", age_hours=1)
+    session_service._session_index = None  # force a rescan to pick up both
+
+    sessions = session_service.list_sessions()
+    assert all("path" not in meta for meta in sessions)
+    assert {meta["token"] for meta in sessions} == {created["token"], "abc"}
+
+
+def test_register_session_file_makes_session_visible(storage):
+    session_service._get_session_index()  # index built before the write
+    _write_session(storage, "preprocessed_xyz.json", "xyz", age_hours=48)
+    session_service.register_session_file(
+        storage / "preprocessed_xyz.json", "xyz", "UTC",
+        (datetime.utcnow() - timedelta(hours=48)).isoformat() + "Z")
+
+    assert {m["token"] for m in session_service.list_sessions()} == {"xyz"}
+    assert session_service.cleanup_expired_sessions(max_age_hours=24) == 1
+    assert not (storage / "preprocessed_xyz.json").exists()
+
+
+def test_cleanup_removes_expired_preprocessed_file(storage):
+    # preprocessed_{token}.json does not match {token}.json, so cleanup
+    # must delete the file the index entry was built from
+    _write_session(storage, "preprocessed_old.json", "old", age_hours=48)
+    _write_session(storage, "preprocessed_new.json", "new", age_hours=1)
+
+    deleted = session_service.cleanup_expired_sessions(max_age_hours=24)
+
+    assert deleted == 1
+    assert not (storage / "preprocessed_old.json").exists()
+    assert (storage / "preprocessed_new.json").exists()
+    assert {m["token"] for m in session_service.list_sessions()} == {"new"}
+
+
+def test_cleanup_does_not_count_already_deleted_files(storage):
+    _write_session(storage, "preprocessed_old.json", "old", age_hours=48)
+    session_service._get_session_index()  # build the index first
+    (storage / "preprocessed_old.json").unlink()
+
+    assert session_service.cleanup_expired_sessions(max_age_hours=24) == 0
+    assert session_service.list_sessions() == []
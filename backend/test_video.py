@@ -1,22 +1,39 @@
-"""Test video category scraper"""
-import sys
-sys.path.insert(0, '.')
+"""Tests for the video metadata scraper's offline parsing helpers."""
 
-from services.video_service import get_video_metadata
-import json
+import pytest
 
-# Test with a real video
-test_url = "https://www.youtube.com/watch?v=GopDfbvyY0k"
-print(f"Testing with: {test_url}")
+from services.video_service import extract_video_id, extract_player_response
 
-# print("\n--- Category only ---")
-# category = get_video_category(test_url)
-# print(f"Category: {category}")
 
-print("\n--- Full metadata ---")
-metadata = get_video_metadata(test_url)
-print(json.dumps(metadata, indent=2, default=str))
+@pytest.mark.parametrize("url,video_id", [
+    ("https://www.youtube.com/watch?v=GopDfbvyY0k", "GopDfbvyY0k"),
+    ("https://www.youtube.com/watch?v=GopDfbvyY0k&t=10s", "GopDfbvyY0k"),
+    ("https://youtu.be/GopDfbvyY0k", "GopDfbvyY0k"),
+    ("https://www.youtube.com/embed/GopDfbvyY0k", "GopDfbvyY0k"),
+    ("https://example.com/watch", None),
+    ("", None),
+])
+def test_extract_video_id(url, video_id):
+    assert extract_video_id(url) == video_id
 
-# Extract just the category
-category = metadata.get("category")
-print(f"\n✅ Category: {category}")
+
+def test_extract_player_response():
+    html = (
+        '<script>var ytInitialPlayerResponse = '
+        '{"videoDetails": {"title": "T"}};var other = 1;</script>'
+    )
+    assert extract_player_response(html) == {"videoDetails": {"title": "T"}}
+
+
+def test_extract_player_response_skips_false_positives():
+    # The marker appearing inside a string must not short-circuit the scan
+    html = (
+        '<script>var s = "mentions ytInitialPlayerResponse only";'
+        'var ytInitialPlayerResponse = {"ok": true};</script>'
+    )
+    assert extract_player_response(html) == {"ok": True}
+
+
+def test_extract_player_response_missing():
+    assert extract_player_response("<html></html>") is None
+    assert extract_player_response("") is None
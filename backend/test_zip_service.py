@@ -0,0 +1,131 @@
+"""Tests for Takeout ZIP scanning and extraction."""
+
+import io
+import json
+import zipfile
+
+import pytest
+
+from services.zip_service import (
+    read_zip_for_files,
+    extract_files_by_paths,
+    scan_and_extract,
+    open_text_entry,
+)
+
+WATCH_PATH = "Takeout/YouTube/history/watch-history.json"
+SEARCH_PATH = "Takeout/YouTube/history/search-history.json"
+SUBS_PATH = "Takeout/YouTube/subscriptions/subscriptions.csv"
+
+
+@pytest.fixture()
+def takeout_zip() -> bytes:
+    """A small Takeout-shaped archive with noise entries around the targets."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(WATCH_PATH, json.dumps(
+            [{"title": "Watched x", "time": "2024-01-01T00:00:00Z"}] * 50))
+        zf.writestr(SEARCH_PATH, json.dumps([{"title": "Searched y"}]))
+        zf.writestr(SUBS_PATH,
+                    "Channel Id,Channel Url,Channel Title\nabc,url,Café\n")
+        for i in range(50):
+            zf.writestr(f"Takeout/YouTube/videos/v{i}.json", "{}")
+    return buf.getvalue()
+
+
+def test_read_zip_for_files(takeout_zip):
+    result = read_zip_for_files(takeout_zip)
+
+    assert result["missing_files"] == []
+    assert result["total_files_in_zip"] == 53
+    assert result["found_files"]["watch-history.json"] == WATCH_PATH
+    assert result["found_files"]["subscriptions.csv"] == SUBS_PATH
+
+
+def test_read_zip_reports_missing(takeout_zip):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(WATCH_PATH, "[]")
+
+    result = read_zip_for_files(buf.getvalue())
+    assert sorted(result["missing_files"]) == [
+        "search-history.json", "subscriptions.csv"
+    ]
+
+
+def test_extract_files_by_paths(takeout_zip):
+    files, missing = extract_files_by_paths(takeout_zip, {
+        "watch-history.json": WATCH_PATH,
+        "subscriptions.csv": SUBS_PATH,
+    })
+
+    assert missing == []
+    by_name = {f["filename"]: f for f in files}
+    assert json.loads(by_name["watch-history.json"]["content"])[0]["title"] == "Watched x"
+    assert by_name["watch-history.json"]["content_type"] == "json"
+    assert by_name["subscriptions.csv"]["content_type"] == "csv"
+    assert "Café" in by_name["subscriptions.csv"]["content"]
+    assert by_name["subscriptions.csv"]["size_bytes"] > 0
+
+
+def test_extract_reports_missing_paths(takeout_zip):
+    files, missing = extract_files_by_paths(
+        takeout_zip, {"nope.json": "not/there.json"})
+    assert files == []
+    assert missing == ["nope.json"]
+
+
+def test_extract_accepts_file_object(takeout_zip):
+    files, missing = extract_files_by_paths(
+        io.BytesIO(takeout_zip), {"watch-history.json": WATCH_PATH})
+    assert missing == []
+    assert files[0]["filename"] == "watch-history.json"
+
+
+def test_scan_and_extract_single_pass(takeout_zip):
+    files, missing = scan_and_extract(takeout_zip)
+
+    assert missing == []
+    assert {f["filename"] for f in files} == {
+        "watch-history.json", "search-history.json", "subscriptions.csv"
+    }
+
+
+def test_open_text_entry_streams_json(takeout_zip):
+    with open_text_entry(takeout_zip, WATCH_PATH) as stream:
+        data = json.load(stream)
+    assert data[0]["title"] == "Watched x"
+
+
+def test_invalid_zip_raises():
+    with pytest.raises(ValueError):
+        read_zip_for_files(b"this is not a zip")
+    with pytest.raises(ValueError):
+        extract_files_by_paths(b"nope", {"a": "b"})
+
+
+def test_oversized_entry_rejected(takeout_zip, monkeypatch):
+    import services.zip_service as zip_service
+    monkeypatch.setattr(zip_service, "MAX_ENTRY_BYTES", 10)
+
+    with pytest.raises(ValueError):
+        extract_files_by_paths(takeout_zip, {"watch-history.json": WATCH_PATH})
+
+
+def test_oversized_total_rejected(takeout_zip, monkeypatch):
+    import services.zip_service as zip_service
+    monkeypatch.setattr(zip_service, "MAX_TOTAL_BYTES", 10)
+
+    with pytest.raises(ValueError):
+        scan_and_extract(takeout_zip)
+
+
+def test_invalid_utf8_is_replaced():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("bad.json", b'{"t": "\xff\xfe bad bytes"}')
+
+    files, missing = extract_files_by_paths(
+        buf.getvalue(), {"bad.json": "bad.json"})
+    assert missing == []
+    assert "�" in files[0]["content"]